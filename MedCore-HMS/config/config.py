@@ -6,11 +6,28 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # Connection pool configuration (per worker process)
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 20)),
+        'pool_timeout': 30,
+        'pool_recycle': 1800,
+        'pool_pre_ping': True,
+    }
+    
     # Session configuration
     PERMANENT_SESSION_LIFETIME = timedelta(hours=24)
     SESSION_COOKIE_SECURE = True
     SESSION_COOKIE_HTTPONLY = True
     SESSION_COOKIE_SAMESITE = 'Lax'
     
+    # Template configuration
+    # None leaves Flask's default: reload templates only in debug mode
+    TEMPLATES_AUTO_RELOAD = True if os.environ.get('TEMPLATES_AUTO_RELOAD') == '1' else None
+    # None lets Jinja use its own per-user cache directory (mode 0700,
+    # ownership checked) rather than a shared, predictable path
+    JINJA_CACHE_DIR = os.environ.get('JINJA_CACHE_DIR')
+    PRELOAD_TEMPLATES = ('auth/login.html', 'dashboard/index.html')
+    
     # Flask-Login configuration
     REMEMBER_COOKIE_DURATION = timedelta(days=7)
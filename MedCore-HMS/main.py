@@ -1,4 +1,5 @@
 from flask import Flask, redirect, url_for
+from jinja2 import FileSystemBytecodeCache
 from config import Config
 from models import db, login_manager, migrate
 import os
@@ -19,14 +20,12 @@ def create_app():
     
     # Import models to ensure they're registered with SQLAlchemy
     with app.app_context():
-        from models import user, patient, department, room, treatment, medication, vital_sign, activity_log
+        from models import user, patient, department, room, treatment, medication, vital_sign, activity_log, dashboard_stat
     
     # Register blueprints
     from routes.auth import auth_bp
     from routes.dashboard import dashboard_bp
-    from routes.patients import patients_bp
-    from routes.medical_records import medical_records_bp
-    from routes.hospital import hospital_bp
+    from routes.stubs import patients_bp, medical_records_bp, hospital_bp
     
     app.register_blueprint(auth_bp)
     app.register_blueprint(dashboard_bp)
@@ -34,6 +33,15 @@ def create_app():
     app.register_blueprint(medical_records_bp)
     app.register_blueprint(hospital_bp)
     
+    # Cache compiled templates on disk and compile the hot ones up front,
+    # so fresh workers don't pay template compilation on their first requests
+    cache_dir = app.config['JINJA_CACHE_DIR']
+    if cache_dir:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+    for template in app.config['PRELOAD_TEMPLATES']:
+        app.jinja_env.get_template(template)
+    
     @app.route('/')
     def index():
         return redirect(url_for('dashboard.index'))
@@ -43,5 +51,9 @@ def create_app():
 app = create_app()
 
 if __name__ == '__main__':
+    # Local development server only (production runs under gunicorn, see
+    # README). The debugger and reloader are opt-in: the reloader stats
+    # every source file and the debugger wraps every request.
     port = int(os.getenv('PORT', 5000))
-    app.run(host='0.0.0.0', port=port, debug=True)
+    debug = os.getenv('FLASK_DEBUG') == '1'
+    app.run(host='0.0.0.0', port=port, debug=debug, threaded=True)
@@ -1,6 +1,7 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
 from flask_migrate import Migrate
+from sqlalchemy.orm import load_only
 
 db = SQLAlchemy()
 login_manager = LoginManager()
@@ -8,5 +9,9 @@ migrate = Migrate()
 
 @login_manager.user_loader
 def load_user(user_id):
+    # Flask-Login memoizes the result on g, so this runs at most once per request.
+    # Session.get checks the identity map first and only fetches what templates read.
     from models.user import User
-    return User.query.get(int(user_id))
+    return db.session.get(User, int(user_id), options=[
+        load_only(User.id, User.username, User.full_name, User.role, User.active)
+    ])
@@ -1,5 +1,4 @@
 from models import db
-from datetime import datetime
 
 class ActivityLog(db.Model):
     __tablename__ = 'activity_logs'
@@ -11,10 +10,10 @@ class ActivityLog(db.Model):
     entity_id = db.Column(db.Integer, nullable=True)
     details = db.Column(db.Text, nullable=True)
     ip_address = db.Column(db.String(50), nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime(timezone=True), server_default=db.func.now(), nullable=False)
     
     # Relationships
-    user = db.relationship('User', backref='activity_logs')
+    user = db.relationship('User', back_populates='activity_logs')
     
     def __repr__(self):
         return f'<ActivityLog {self.action} by User ID {self.user_id}>'
@@ -0,0 +1,10 @@
+from models import db
+
+class DashboardStat(db.Model):
+    __tablename__ = 'dashboard_stats'
+    
+    key = db.Column(db.String(50), primary_key=True)  # patients_total, patients_active, rooms_occupied, etc.
+    value = db.Column(db.Integer, default=0, nullable=False)
+    
+    def __repr__(self):
+        return f'<DashboardStat {self.key}={self.value}>'
@@ -1,5 +1,4 @@
 from models import db
-from datetime import datetime
 
 class Department(db.Model):
     __tablename__ = 'departments'
@@ -8,10 +7,12 @@ class Department(db.Model):
     name = db.Column(db.String(100), unique=True, nullable=False)
     description = db.Column(db.Text, nullable=True)
     head_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime(timezone=True), server_default=db.func.now(), nullable=False)
     
     # Relationships
-    head = db.relationship('User', foreign_keys=[head_id], backref='headed_department')
+    head = db.relationship('User', foreign_keys=[head_id], back_populates='headed_department')
+    staff = db.relationship('User', foreign_keys='User.department_id', back_populates='department', lazy='raise_on_sql')
+    rooms = db.relationship('Room', back_populates='department', lazy='raise_on_sql')
     
     def __repr__(self):
         return f'<Department {self.name}>'
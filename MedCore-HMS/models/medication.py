@@ -1,5 +1,4 @@
 from models import db
-from datetime import datetime
 
 class Medication(db.Model):
     __tablename__ = 'medications'
@@ -15,11 +14,11 @@ class Medication(db.Model):
     end_date = db.Column(db.DateTime, nullable=True)
     status = db.Column(db.String(50), default='active', nullable=False)  # active, completed, discontinued
     notes = db.Column(db.Text, nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime(timezone=True), server_default=db.func.now(), nullable=False)
     
     # Relationships
-    patient = db.relationship('Patient', backref='medications')
-    prescribed_by = db.relationship('User', backref='prescribed_medications')
+    patient = db.relationship('Patient', back_populates='medications')
+    prescribed_by = db.relationship('User', back_populates='prescribed_medications')
     
     def __repr__(self):
         return f'<Medication {self.medication_name} for Patient ID {self.patient_id}>'
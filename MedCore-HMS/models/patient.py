@@ -1,8 +1,10 @@
 from models import db
-from datetime import datetime
 
 class Patient(db.Model):
     __tablename__ = 'patients'
+    __table_args__ = (
+        db.Index('ix_patient_status_created', 'status', 'created_at'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     medical_record_number = db.Column(db.String(50), unique=True, nullable=False, index=True)
@@ -12,30 +14,36 @@ class Patient(db.Model):
     blood_type = db.Column(db.String(5), nullable=True)
     phone = db.Column(db.String(20), nullable=True)
     email = db.Column(db.String(120), nullable=True)
-    address = db.Column(db.Text, nullable=True)
+    address = db.deferred(db.Column(db.Text, nullable=True))
     emergency_contact_name = db.Column(db.String(200), nullable=True)
     emergency_contact_phone = db.Column(db.String(20), nullable=True)
     
-    # Medical information
+    # Medical information (large TEXT columns are deferred and load together on first access)
     admission_date = db.Column(db.DateTime, nullable=True)
     discharge_date = db.Column(db.DateTime, nullable=True)
-    diagnosis = db.Column(db.Text, nullable=True)
-    medical_history = db.Column(db.Text, nullable=True)
-    allergies = db.Column(db.Text, nullable=True)
-    status = db.Column(db.String(50), default='active', nullable=False)  # active, discharged, critical
+    diagnosis = db.deferred(db.Column(db.Text, nullable=True), group='clinical')
+    medical_history = db.deferred(db.Column(db.Text, nullable=True), group='clinical')
+    allergies = db.deferred(db.Column(db.Text, nullable=True), group='clinical')
+    # active, discharged, critical. active_history loads the old value before
+    # a change so the dashboard counters can move it between statuses.
+    status = db.column_property(db.Column(db.String(50), default='active', nullable=False), active_history=True)
     
     # Assignments
     assigned_doctor_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
     assigned_nurse_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
     room_id = db.Column(db.Integer, db.ForeignKey('rooms.id'), nullable=True)
     
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime(timezone=True), server_default=db.func.now(), nullable=False, index=True)
+    updated_at = db.Column(db.DateTime(timezone=True), server_default=db.func.now(), onupdate=db.func.now(), nullable=False)
     
     # Relationships
-    assigned_doctor = db.relationship('User', foreign_keys=[assigned_doctor_id], backref='patients_as_doctor')
-    assigned_nurse = db.relationship('User', foreign_keys=[assigned_nurse_id], backref='patients_as_nurse')
-    room = db.relationship('Room', foreign_keys=[room_id], backref='patients')
+    assigned_doctor = db.relationship('User', foreign_keys=[assigned_doctor_id], back_populates='patients_as_doctor')
+    assigned_nurse = db.relationship('User', foreign_keys=[assigned_nurse_id], back_populates='patients_as_nurse')
+    room = db.relationship('Room', foreign_keys=[room_id], back_populates='patients')
+    current_room = db.relationship('Room', foreign_keys='Room.current_patient_id', back_populates='current_patient', lazy='raise_on_sql')
+    treatments = db.relationship('Treatment', back_populates='patient', lazy='raise_on_sql')
+    medications = db.relationship('Medication', back_populates='patient', lazy='raise_on_sql')
+    vital_signs = db.relationship('VitalSign', back_populates='patient', lazy='raise_on_sql')
     
     def __repr__(self):
         return f'<Patient {self.full_name} (MRN: {self.medical_record_number})>'
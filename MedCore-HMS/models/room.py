@@ -1,5 +1,4 @@
 from models import db
-from datetime import datetime
 
 class Room(db.Model):
     __tablename__ = 'rooms'
@@ -8,13 +7,15 @@ class Room(db.Model):
     room_number = db.Column(db.String(20), unique=True, nullable=False)
     room_type = db.Column(db.String(50), nullable=False)  # ICU, ER, General Ward, OR, Pediatric
     department_id = db.Column(db.Integer, db.ForeignKey('departments.id'), nullable=True)
-    is_occupied = db.Column(db.Boolean, default=False, nullable=False)
+    # active_history: see Patient.status
+    is_occupied = db.column_property(db.Column(db.Boolean, default=False, nullable=False, index=True), active_history=True)
     current_patient_id = db.Column(db.Integer, db.ForeignKey('patients.id'), nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime(timezone=True), server_default=db.func.now(), nullable=False)
     
     # Relationships
-    department = db.relationship('Department', backref='rooms')
-    current_patient = db.relationship('Patient', foreign_keys=[current_patient_id], backref='current_room')
+    department = db.relationship('Department', back_populates='rooms')
+    current_patient = db.relationship('Patient', foreign_keys=[current_patient_id], back_populates='current_room')
+    patients = db.relationship('Patient', foreign_keys='Patient.room_id', back_populates='room', lazy='raise_on_sql')
     
     def __repr__(self):
         return f'<Room {self.room_number} ({self.room_type})>'
@@ -1,5 +1,4 @@
 from models import db
-from datetime import datetime
 
 class Treatment(db.Model):
     __tablename__ = 'treatments'
@@ -13,11 +12,11 @@ class Treatment(db.Model):
     end_date = db.Column(db.DateTime, nullable=True)
     status = db.Column(db.String(50), default='ongoing', nullable=False)  # ongoing, completed, discontinued
     notes = db.Column(db.Text, nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime(timezone=True), server_default=db.func.now(), nullable=False)
     
     # Relationships
-    patient = db.relationship('Patient', backref='treatments')
-    prescribed_by = db.relationship('User', backref='prescribed_treatments')
+    patient = db.relationship('Patient', back_populates='treatments')
+    prescribed_by = db.relationship('User', back_populates='prescribed_treatments')
     
     def __repr__(self):
         return f'<Treatment {self.treatment_type} for Patient ID {self.patient_id}>'
@@ -1,7 +1,29 @@
 from models import db
 from flask_login import UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
-from datetime import datetime
+import base64
+import hashlib
+import os
+import bcrypt
+
+# bcrypt work factor; raise via BCRYPT_COST as hardware gets faster
+BCRYPT_COST = int(os.getenv('BCRYPT_COST', '12'))
+
+# bcrypt only reads the first 72 bytes of a password (bcrypt 5 raises
+# ValueError beyond that)
+BCRYPT_MAX_BYTES = 72
+
+def _bcrypt_input(password):
+    # Longer passwords are pre-hashed to a 44-byte base64 SHA-256 digest, so
+    # every byte still counts and bcrypt never sees more than it accepts.
+    # Passwords within the limit are passed through, so existing hashes verify.
+    encoded = password.encode('utf-8')
+    if len(encoded) > BCRYPT_MAX_BYTES:
+        encoded = base64.b64encode(hashlib.sha256(encoded).digest())
+    return encoded
+
+def hash_password(password):
+    salt = bcrypt.gensalt(rounds=BCRYPT_COST)
+    return bcrypt.hashpw(_bcrypt_input(password), salt).decode('ascii')
 
 class User(UserMixin, db.Model):
     __tablename__ = 'users'
@@ -14,20 +36,41 @@ class User(UserMixin, db.Model):
     role = db.Column(db.String(50), nullable=False)  # administrator, physician, nurse, specialist, resident
     department_id = db.Column(db.Integer, db.ForeignKey('departments.id'), nullable=True)
     active = db.Column(db.Boolean, default=True, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime(timezone=True), server_default=db.func.now(), nullable=False)
     
     @property
     def is_active(self):
         return self.active
     
     # Relationships
-    department = db.relationship('Department', foreign_keys=[department_id], backref='staff')
+    department = db.relationship('Department', foreign_keys=[department_id], back_populates='staff')
+    headed_department = db.relationship('Department', foreign_keys='Department.head_id', back_populates='head', lazy='raise_on_sql')
+    patients_as_doctor = db.relationship('Patient', foreign_keys='Patient.assigned_doctor_id', back_populates='assigned_doctor', lazy='raise_on_sql')
+    patients_as_nurse = db.relationship('Patient', foreign_keys='Patient.assigned_nurse_id', back_populates='assigned_nurse', lazy='raise_on_sql')
+    prescribed_treatments = db.relationship('Treatment', back_populates='prescribed_by', lazy='raise_on_sql')
+    prescribed_medications = db.relationship('Medication', back_populates='prescribed_by', lazy='raise_on_sql')
+    recorded_vital_signs = db.relationship('VitalSign', back_populates='recorded_by', lazy='raise_on_sql')
+    activity_logs = db.relationship('ActivityLog', back_populates='user', lazy='raise_on_sql')
     
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = hash_password(password)
     
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        if not self.password_hash.startswith('$2'):
+            # Legacy werkzeug hash created before the switch to bcrypt
+            from werkzeug.security import check_password_hash
+            return check_password_hash(self.password_hash, password)
+        try:
+            return bcrypt.checkpw(_bcrypt_input(password), self.password_hash.encode('ascii'))
+        except ValueError:
+            # Malformed stored hash
+            return False
+    
+    def password_needs_rehash(self):
+        # bcrypt hashes look like $2b$<cost>$<salt+digest>
+        if not self.password_hash.startswith('$2'):
+            return True
+        return int(self.password_hash.split('$')[2]) != BCRYPT_COST
     
     def has_role(self, *roles):
         return self.role in roles
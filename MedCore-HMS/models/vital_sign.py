@@ -1,5 +1,4 @@
 from models import db
-from datetime import datetime
 
 class VitalSign(db.Model):
     __tablename__ = 'vital_signs'
@@ -18,11 +17,11 @@ class VitalSign(db.Model):
     blood_glucose = db.Column(db.Float, nullable=True)  # mg/dL
     
     notes = db.Column(db.Text, nullable=True)
-    recorded_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    recorded_at = db.Column(db.DateTime(timezone=True), server_default=db.func.now(), nullable=False)
     
     # Relationships
-    patient = db.relationship('Patient', backref='vital_signs')
-    recorded_by = db.relationship('User', backref='recorded_vital_signs')
+    patient = db.relationship('Patient', back_populates='vital_signs')
+    recorded_by = db.relationship('User', back_populates='recorded_vital_signs')
     
     def __repr__(self):
         return f'<VitalSign for Patient ID {self.patient_id} at {self.recorded_at}>'
@@ -2,10 +2,26 @@ from flask import Blueprint, render_template, redirect, url_for, flash, request
 from flask_login import login_user, logout_user, login_required, current_user
 from models import db
 from models.user import User
-from models.activity_log import ActivityLog
+from services.activity_log import log_activity
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import load_only
+import secrets
 
 auth_bp = Blueprint('auth', __name__, url_prefix='/auth')
 
+# Checked against when the username is unknown, so that both branches of
+# login() pay for one password verification and timing doesn't leak usernames
+_dummy_user = User()
+_dummy_user.set_password(secrets.token_urlsafe(16))
+
+# Longer submitted passwords are rejected without being hashed
+MAX_PASSWORD_LENGTH = 1024
+
+# Built once so each login reuses the same statement and its cached compiled SQL
+_user_by_username = select(User).where(User.username == bindparam('username')).options(
+    load_only(User.id, User.username, User.password_hash, User.active)
+)
+
 @auth_bp.route('/login', methods=['GET', 'POST'])
 def login():
     if current_user.is_authenticated:
@@ -16,21 +32,31 @@ def login():
         password = request.form.get('password')
         remember = request.form.get('remember', False) == 'on'
         
-        user = User.query.filter_by(username=username).first()
+        user = db.session.scalars(_user_by_username, {'username': username}).first()
+        password = password or ''
+        if len(password) > MAX_PASSWORD_LENGTH:
+            # Still verify against the dummy hash so timing matches a wrong password
+            _dummy_user.check_password('')
+            password_ok = False
+        else:
+            password_ok = (user or _dummy_user).check_password(password)
         
-        if user and user.check_password(password):
+        if user and password_ok:
+            if user.password_needs_rehash():
+                # Upgrade legacy hashes and apply BCRYPT_COST changes on next login
+                user.set_password(password)
+            
             login_user(user, remember=remember)
             
             # Log activity
-            log = ActivityLog(
+            log_activity(
                 user_id=user.id,
                 action='login',
                 entity_type='user',
                 entity_id=user.id,
-                details=f'User {user.username} logged in',
-                ip_address=request.remote_addr
+                details=f'User {user.username} logged in'
             )
-            db.session.add(log)
+            # One commit for the log row and any password rehash
             db.session.commit()
             
             flash('Login successful!', 'success')
@@ -45,15 +71,13 @@ def login():
 @login_required
 def logout():
     # Log activity
-    log = ActivityLog(
+    log_activity(
         user_id=current_user.id,
         action='logout',
         entity_type='user',
         entity_id=current_user.id,
-        details=f'User {current_user.username} logged out',
-        ip_address=request.remote_addr
+        details=f'User {current_user.username} logged out'
     )
-    db.session.add(log)
     db.session.commit()
     
     logout_user()
@@ -1,30 +1,38 @@
 from flask import Blueprint, render_template
 from flask_login import login_required, current_user
-from models import db
 from models.patient import Patient
-from models.room import Room
 from models.user import User
-from sqlalchemy import func
+from services.dashboard_stats import get_dashboard_stats
+from sqlalchemy.orm import load_only, raiseload, selectinload
 
 dashboard_bp = Blueprint('dashboard', __name__, url_prefix='/dashboard')
 
 @dashboard_bp.route('/')
 @login_required
 def index():
-    # Get statistics
-    total_patients = Patient.query.count()
-    active_patients = Patient.query.filter_by(status='active').count()
-    critical_patients = Patient.query.filter_by(status='critical').count()
-    discharged_patients = Patient.query.filter_by(status='discharged').count()
+    # Get statistics from the maintained counters
+    stats = get_dashboard_stats()
     
-    total_rooms = Room.query.count()
-    occupied_rooms = Room.query.filter_by(is_occupied=True).count()
+    total_patients = stats.get('total_patients', 0)
+    active_patients = stats.get('active_patients', 0)
+    critical_patients = stats.get('critical_patients', 0)
+    discharged_patients = stats.get('discharged_patients', 0)
+    
+    total_rooms = stats.get('total_rooms', 0)
+    occupied_rooms = stats.get('occupied_rooms', 0)
     available_rooms = total_rooms - occupied_rooms
     
-    total_staff = User.query.count()
+    total_staff = stats.get('total_staff', 0)
     
-    # Get recent patients
-    recent_patients = Patient.query.order_by(Patient.created_at.desc()).limit(5).all()
+    # Get recent patients, loading only the columns the dashboard renders.
+    # The assigned doctor is eager-loaded in one extra query; any other
+    # relationship access from the template raises instead of lazy-loading.
+    recent_patients = Patient.query.options(
+        load_only(Patient.id, Patient.medical_record_number, Patient.full_name, Patient.status,
+                  Patient.admission_date, Patient.assigned_doctor_id, Patient.created_at),
+        selectinload(Patient.assigned_doctor).load_only(User.id, User.full_name),
+        raiseload('*'),
+    ).order_by(Patient.created_at.desc()).limit(5).all()
     
     return render_template('dashboard/index.html',
                          total_patients=total_patients,
@@ -0,0 +1,14 @@
+from flask import Blueprint
+
+# Placeholder modules that haven't been built yet. They share one module so
+# startup imports a single file, but each keeps its own blueprint so endpoint
+# names (patients.index, ...) stay stable when the real modules land.
+
+def _stub_blueprint(name, url_prefix, title):
+    bp = Blueprint(name, __name__, url_prefix=url_prefix)
+    bp.add_url_rule('/', 'index', lambda: f'{title} module - Coming soon')
+    return bp
+
+patients_bp = _stub_blueprint('patients', '/patients', 'Patients')
+medical_records_bp = _stub_blueprint('medical_records', '/medical-records', 'Medical Records')
+hospital_bp = _stub_blueprint('hospital', '/hospital', 'Hospital Resources')
@@ -1,12 +1,19 @@
 from main import app
 from models import db
-from models.user import User
+from models.user import User, hash_password
 from models.department import Department
 from models.room import Room
 from models.patient import Patient
 from datetime import datetime, date, timedelta
+from services.dashboard_stats import rebuild_dashboard_stats
+from sqlalchemy import insert, update
 import random
 
+def _bulk_insert(model, rows):
+    """Insert rows in one executemany and return their new ids in row order."""
+    stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+    return db.session.scalars(stmt, rows).all()
+
 def seed_database():
     with app.app_context():
         # Check if data already exists
@@ -18,98 +25,89 @@ def seed_database():
         
         # Create departments
         departments = [
-            Department(name='Emergency', description='Emergency Department'),
-            Department(name='Internal Medicine', description='Internal Medicine Department'),
-            Department(name='Cardiology', description='Cardiology Department'),
-            Department(name='Surgery', description='Surgery Department'),
-            Department(name='Pediatrics', description='Pediatrics Department')
+            {'name': 'Emergency', 'description': 'Emergency Department'},
+            {'name': 'Internal Medicine', 'description': 'Internal Medicine Department'},
+            {'name': 'Cardiology', 'description': 'Cardiology Department'},
+            {'name': 'Surgery', 'description': 'Surgery Department'},
+            {'name': 'Pediatrics', 'description': 'Pediatrics Department'}
         ]
-        
-        for dept in departments:
-            db.session.add(dept)
-        
-        db.session.commit()
+        department_ids = _bulk_insert(Department, departments)
         print("Departments created")
         
-        # Create users
+        # Create users (default password for all users: admin)
         users = [
-            User(
-                username='admin',
-                email='admin@medcore.com',
-                full_name='System Administrator',
-                role='administrator',
-                department_id=None
-            ),
-            User(
-                username='dr.williams',
-                email='williams@medcore.com',
-                full_name='Dr. Sarah Williams',
-                role='physician',
-                department_id=departments[1].id
-            ),
-            User(
-                username='dr.johnson',
-                email='johnson@medcore.com',
-                full_name='Dr. Michael Johnson',
-                role='physician',
-                department_id=departments[2].id
-            ),
-            User(
-                username='dr.brown',
-                email='brown@medcore.com',
-                full_name='Dr. Emily Brown',
-                role='specialist',
-                department_id=departments[3].id
-            ),
-            User(
-                username='nurse.davis',
-                email='davis@medcore.com',
-                full_name='Nurse Jennifer Davis',
-                role='nurse',
-                department_id=departments[0].id
-            ),
-            User(
-                username='nurse.miller',
-                email='miller@medcore.com',
-                full_name='Nurse Robert Miller',
-                role='nurse',
-                department_id=departments[1].id
-            )
+            {
+                'username': 'admin',
+                'email': 'admin@medcore.com',
+                'full_name': 'System Administrator',
+                'role': 'administrator',
+                'department_id': None
+            },
+            {
+                'username': 'dr.williams',
+                'email': 'williams@medcore.com',
+                'full_name': 'Dr. Sarah Williams',
+                'role': 'physician',
+                'department_id': department_ids[1]
+            },
+            {
+                'username': 'dr.johnson',
+                'email': 'johnson@medcore.com',
+                'full_name': 'Dr. Michael Johnson',
+                'role': 'physician',
+                'department_id': department_ids[2]
+            },
+            {
+                'username': 'dr.brown',
+                'email': 'brown@medcore.com',
+                'full_name': 'Dr. Emily Brown',
+                'role': 'specialist',
+                'department_id': department_ids[3]
+            },
+            {
+                'username': 'nurse.davis',
+                'email': 'davis@medcore.com',
+                'full_name': 'Nurse Jennifer Davis',
+                'role': 'nurse',
+                'department_id': department_ids[0]
+            },
+            {
+                'username': 'nurse.miller',
+                'email': 'miller@medcore.com',
+                'full_name': 'Nurse Robert Miller',
+                'role': 'nurse',
+                'department_id': department_ids[1]
+            }
         ]
-        
-        # Set default password for all users
+        # Hash the shared password once rather than running the KDF per user
+        admin_hash = hash_password('admin')
         for user in users:
-            user.set_password('admin')
-            db.session.add(user)
-        
-        db.session.commit()
+            user['password_hash'] = admin_hash
+        user_ids = _bulk_insert(User, users)
         print("Users created (default password: admin)")
         
         # Update department heads
-        departments[0].head_id = users[4].id  # Nurse Davis heads Emergency
-        departments[1].head_id = users[1].id  # Dr. Williams heads Internal Medicine
-        departments[2].head_id = users[2].id  # Dr. Johnson heads Cardiology
-        departments[3].head_id = users[3].id  # Dr. Brown heads Surgery
-        departments[4].head_id = users[1].id  # Dr. Williams also heads Pediatrics
-        
-        db.session.commit()
+        db.session.execute(update(Department), [
+            {'id': department_ids[0], 'head_id': user_ids[4]},  # Nurse Davis heads Emergency
+            {'id': department_ids[1], 'head_id': user_ids[1]},  # Dr. Williams heads Internal Medicine
+            {'id': department_ids[2], 'head_id': user_ids[2]},  # Dr. Johnson heads Cardiology
+            {'id': department_ids[3], 'head_id': user_ids[3]},  # Dr. Brown heads Surgery
+            {'id': department_ids[4], 'head_id': user_ids[1]},  # Dr. Williams also heads Pediatrics
+        ])
         
         # Create rooms
         room_types = ['ICU', 'ER', 'General Ward', 'OR', 'Pediatric']
-        rooms = []
-        
-        for i, room_type in enumerate(room_types):
-            for j in range(1, 5):
-                room = Room(
-                    room_number=f'{i+1}0{j}',
-                    room_type=room_type,
-                    department_id=departments[i].id,
-                    is_occupied=False
-                )
-                rooms.append(room)
-                db.session.add(room)
-        
-        db.session.commit()
+        rooms = [
+            {
+                'room_number': f'{i+1}0{j}',
+                'room_type': room_type,
+                'department_id': department_ids[i],
+                'is_occupied': False
+            }
+            for i, room_type in enumerate(room_types)
+            for j in range(1, 5)
+        ]
+        room_ids = _bulk_insert(Room, rooms)
         print("Rooms created")
         
         # Create sample patients
@@ -122,9 +120,9 @@ def seed_database():
                 'phone': '555-0101',
                 'diagnosis': 'Hypertension',
                 'status': 'active',
-                'assigned_doctor': users[1],
-                'assigned_nurse': users[5],
-                'room': rooms[0]
+                'assigned_doctor': 1,
+                'assigned_nurse': 5,
+                'room': 0
             },
             {
                 'full_name': 'Mary Johnson',
@@ -134,9 +132,9 @@ def seed_database():
                 'phone': '555-0102',
                 'diagnosis': 'Diabetes Type 2',
                 'status': 'active',
-                'assigned_doctor': users[1],
-                'assigned_nurse': users[5],
-                'room': rooms[1]
+                'assigned_doctor': 1,
+                'assigned_nurse': 5,
+                'room': 1
             },
             {
                 'full_name': 'Robert Williams',
@@ -146,38 +144,45 @@ def seed_database():
                 'phone': '555-0103',
                 'diagnosis': 'Cardiac Arrhythmia',
                 'status': 'critical',
-                'assigned_doctor': users[2],
-                'assigned_nurse': users[4],
-                'room': rooms[4]
+                'assigned_doctor': 2,
+                'assigned_nurse': 4,
+                'room': 4
+            }
+        ]
+        
+        patients = [
+            {
+                'medical_record_number': f'MRN{datetime.now().year}{idx:05d}',
+                'full_name': patient_data['full_name'],
+                'date_of_birth': patient_data['date_of_birth'],
+                'gender': patient_data['gender'],
+                'blood_type': patient_data['blood_type'],
+                'phone': patient_data['phone'],
+                'email': f"{patient_data['full_name'].lower().replace(' ', '.')}@email.com",
+                'address': f'{random.randint(100, 999)} Main St, City, State',
+                'emergency_contact_name': f"{patient_data['full_name'].split()[0]} Emergency Contact",
+                'emergency_contact_phone': f'555-{random.randint(1000, 9999)}',
+                'admission_date': datetime.now() - timedelta(days=random.randint(1, 10)),
+                'diagnosis': patient_data['diagnosis'],
+                'medical_history': 'See detailed records',
+                'allergies': 'None reported',
+                'status': patient_data['status'],
+                'assigned_doctor_id': user_ids[patient_data['assigned_doctor']],
+                'assigned_nurse_id': user_ids[patient_data['assigned_nurse']],
+                'room_id': room_ids[patient_data['room']]
             }
+            for idx, patient_data in enumerate(patients_data, 1)
         ]
+        patient_ids = _bulk_insert(Patient, patients)
+        
+        # Mark rooms as occupied
+        db.session.execute(update(Room), [
+            {'id': room_ids[patient_data['room']], 'is_occupied': True, 'current_patient_id': patient_id}
+            for patient_data, patient_id in zip(patients_data, patient_ids)
+        ])
         
-        for idx, patient_data in enumerate(patients_data, 1):
-            patient = Patient(
-                medical_record_number=f'MRN{datetime.now().year}{idx:05d}',
-                full_name=patient_data['full_name'],
-                date_of_birth=patient_data['date_of_birth'],
-                gender=patient_data['gender'],
-                blood_type=patient_data['blood_type'],
-                phone=patient_data['phone'],
-                email=f"{patient_data['full_name'].lower().replace(' ', '.')}@email.com",
-                address=f'{random.randint(100, 999)} Main St, City, State',
-                emergency_contact_name=f"{patient_data['full_name'].split()[0]} Emergency Contact",
-                emergency_contact_phone=f'555-{random.randint(1000, 9999)}',
-                admission_date=datetime.now() - timedelta(days=random.randint(1, 10)),
-                diagnosis=patient_data['diagnosis'],
-                medical_history='See detailed records',
-                allergies='None reported',
-                status=patient_data['status'],
-                assigned_doctor_id=patient_data['assigned_doctor'].id,
-                assigned_nurse_id=patient_data['assigned_nurse'].id,
-                room_id=patient_data['room'].id
-            )
-            db.session.add(patient)
-            
-            # Mark room as occupied
-            patient_data['room'].is_occupied = True
-            patient_data['room'].current_patient_id = patient.id
+        # Bulk statements bypass the ORM events that maintain dashboard counters
+        rebuild_dashboard_stats()
         
         db.session.commit()
         print("Sample patients created")
@@ -0,0 +1,19 @@
+from flask import request
+
+from models import db
+from models.activity_log import ActivityLog
+
+# Activity log rows are added to the request's session and committed by the
+# caller together with the change they record, so an audit row is written in
+# the same transaction as (and can't be lost separately from) the action.
+
+
+def log_activity(user_id, action, entity_type, entity_id=None, details=None):
+    db.session.add(ActivityLog(
+        user_id=user_id,
+        action=action,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        details=details,
+        ip_address=request.remote_addr,
+    ))
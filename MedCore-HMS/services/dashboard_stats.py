@@ -0,0 +1,160 @@
+import logging
+
+from sqlalchemy import case, event, func, inspect, select, true, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+
+from models import db
+from models.dashboard_stat import DashboardStat
+from models.patient import Patient
+from models.room import Room
+from models.user import User
+
+# Dashboard counters live in the dashboard_stats table and are adjusted by
+# mapper events as patients, rooms and users change, so the dashboard reads a
+# handful of rows instead of aggregating the base tables on every request.
+# Writes that bypass the ORM (bulk INSERT/UPDATE) must call
+# rebuild_dashboard_stats() afterwards.
+PATIENT_STATUSES = ('active', 'critical', 'discharged')
+
+STAT_KEYS = (
+    'total_patients',
+    *(f'{status}_patients' for status in PATIENT_STATUSES),
+    'total_rooms',
+    'occupied_rooms',
+    'total_staff',
+)
+
+_stats = DashboardStat.__table__
+_upsert_dialects = {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}
+
+logger = logging.getLogger(__name__)
+
+
+def get_dashboard_stats():
+    stats = dict(db.session.execute(select(DashboardStat.key, DashboardStat.value)).all())
+    if len(stats) < len(STAT_KEYS):
+        # Not seeded yet (seed_data.py normally does this). The rebuild
+        # upserts, so concurrent workers doing it at once don't conflict.
+        stats = rebuild_dashboard_stats()
+        db.session.commit()
+    return stats
+
+
+def rebuild_dashboard_stats(connection=None):
+    """Recount every counter from the base tables and upsert the results.
+
+    Pass `connection` when called from a flush event; otherwise the current
+    session is used.
+    """
+    executor = connection if connection is not None else db.session
+    patient_stats = select(
+        func.count(Patient.id).label('total_patients'),
+        *[
+            func.coalesce(func.sum(case((Patient.status == status, 1), else_=0)), 0).label(f'{status}_patients')
+            for status in PATIENT_STATUSES
+        ],
+    ).subquery()
+    room_stats = select(
+        func.count(Room.id).label('total_rooms'),
+        func.coalesce(func.sum(case((Room.is_occupied, 1), else_=0)), 0).label('occupied_rooms'),
+    ).subquery()
+    staff_count = select(func.count(User.id)).scalar_subquery()
+    
+    row = executor.execute(
+        select(patient_stats, room_stats, staff_count.label('total_staff'))
+        .select_from(patient_stats.join(room_stats, true()))
+    ).one()
+    stats = dict(row._mapping)
+    
+    _upsert(executor, stats)
+    return stats
+
+
+def _upsert(executor, stats):
+    rows = [{'key': key, 'value': value} for key, value in stats.items()]
+    bind = executor if isinstance(executor, Connection) else executor.get_bind()
+    dialect_insert = _upsert_dialects.get(bind.dialect.name)
+    if dialect_insert is None:
+        # No portable upsert; fall back to one statement per row
+        for row in rows:
+            if executor.execute(update(_stats).where(_stats.c.key == row['key']).values(value=row['value'])).rowcount == 0:
+                executor.execute(_stats.insert().values(**row))
+        return
+    stmt = dialect_insert(_stats)
+    executor.execute(
+        stmt.on_conflict_do_update(index_elements=[_stats.c.key], set_={'value': stmt.excluded.value}),
+        rows,
+    )
+
+
+def _status_key(status):
+    if status not in PATIENT_STATUSES:
+        # No counter for it; counted in total_patients only
+        logger.warning('Patient status %r has no dashboard counter', status)
+        return None
+    return f'{status}_patients'
+
+
+def _adjust(connection, deltas):
+    for key, delta in deltas.items():
+        if key is not None and delta:
+            connection.execute(
+                update(_stats).where(_stats.c.key == key).values(value=_stats.c.value + delta)
+            )
+
+
+@event.listens_for(Patient, 'after_insert')
+def _patient_inserted(mapper, connection, target):
+    _adjust(connection, {'total_patients': 1, _status_key(target.status): 1})
+
+
+@event.listens_for(Patient, 'after_delete')
+def _patient_deleted(mapper, connection, target):
+    _adjust(connection, {'total_patients': -1, _status_key(target.status): -1})
+
+
+@event.listens_for(Patient, 'after_update')
+def _patient_updated(mapper, connection, target):
+    # Patient.status has active_history, so the old value is loaded before
+    # it is replaced even when the attribute had been expired
+    history = inspect(target).attrs.status.history
+    if not history.added:
+        return
+    if not history.deleted:
+        rebuild_dashboard_stats(connection)
+        return
+    old, new = history.deleted[0], history.added[0]
+    if old != new:
+        _adjust(connection, {_status_key(old): -1, _status_key(new): 1})
+
+
+@event.listens_for(Room, 'after_insert')
+def _room_inserted(mapper, connection, target):
+    _adjust(connection, {'total_rooms': 1, 'occupied_rooms': int(bool(target.is_occupied))})
+
+
+@event.listens_for(Room, 'after_delete')
+def _room_deleted(mapper, connection, target):
+    _adjust(connection, {'total_rooms': -1, 'occupied_rooms': -int(bool(target.is_occupied))})
+
+
+@event.listens_for(Room, 'after_update')
+def _room_updated(mapper, connection, target):
+    history = inspect(target).attrs.is_occupied.history
+    if not history.added:
+        return
+    if not history.deleted:
+        rebuild_dashboard_stats(connection)
+        return
+    _adjust(connection, {'occupied_rooms': int(bool(history.added[0])) - int(bool(history.deleted[0]))})
+
+
+@event.listens_for(User, 'after_insert')
+def _user_inserted(mapper, connection, target):
+    _adjust(connection, {'total_staff': 1})
+
+
+@event.listens_for(User, 'after_delete')
+def _user_deleted(mapper, connection, target):
+    _adjust(connection, {'total_staff': -1})
@@ -12,6 +12,10 @@ Key Functions:
 
 from __future__ import annotations
 
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from finance_app.db.session import create_sqlite_engine, create_session_factory
@@ -19,22 +23,30 @@ from finance_app.models.base import Base
 from finance_app.models import models as m
 
 
-def init_db():
+def init_db(db_path: Optional[Path] = None):
 	"""
 	Initialize the database and create all tables.
 	
 	This function:
-	1. Creates a SQLite engine
+	1. Creates a SQLite engine (WAL mode and tuned PRAGMAs, see db.session)
 	2. Creates all tables defined in the models
 	3. Returns a session factory for database operations
 	
+	Args:
+		db_path (Optional[Path]): Database file, or ":memory:". Uses default if None.
+	
 	Returns:
 		sessionmaker: Factory for creating database sessions
 	"""
 	# Create SQLite engine
-	engine = create_sqlite_engine()
+	engine = create_sqlite_engine(db_path)
 	# Create all tables from model definitions
 	Base.metadata.create_all(engine)
+	# create_all skips existing tables entirely, so add any indexes
+	# introduced since the database file was first created
+	for table in Base.metadata.sorted_tables:
+		for index in table.indexes:
+			index.create(engine, checkfirst=True)
 	# Create session factory
 	SessionLocal = create_session_factory(engine)
 	return SessionLocal
@@ -51,7 +63,8 @@ def seed_minimal(session: Session):
 		session (Session): Database session for operations
 		
 	Note:
-		This function is idempotent - it won't create duplicates if run multiple times
+		This function is idempotent - it won't create duplicates if run multiple times.
+		On an already seeded database it only runs two SELECTs and doesn't commit.
 	"""
 	# Core accounts for double-entry bookkeeping
 	accounts = [
@@ -62,18 +75,26 @@ def seed_minimal(session: Session):
 		("Transfers", "equity"),    # Transfer account for internal transfers
 	]
 	
-	# Create accounts if they don't exist
-	for name, typ in accounts:
-		if not session.query(m.Account).filter_by(name=name).first():
-			session.add(m.Account(name=name, type=typ))
-	
 	# Example expense/income categories for transaction categorization
 	categories = ["Groceries", "Rent", "Utilities", "Dining", "Salary", "Misc"]
-	for name in categories:
-		if not session.query(m.Category).filter_by(name=name).first():
-			session.add(m.Category(name=name))
+	
+	# Fetch existing names in one query per table; on an already seeded
+	# database this is all the work done at startup
+	existing_accounts = set(session.scalars(select(m.Account.name)))
+	existing_categories = set(session.scalars(select(m.Category.name)))
+	
+	# Create accounts if they don't exist
+	missing_accounts = [(name, typ) for name, typ in accounts if name not in existing_accounts]
+	for name, typ in missing_accounts:
+		session.add(m.Account(name=name, type=typ))
+	
+	# Create categories if they don't exist
+	missing_categories = [name for name in categories if name not in existing_categories]
+	for name in missing_categories:
+		session.add(m.Category(name=name))
 
-	# Commit all changes
-	session.commit()
+	# Commit only if anything was added
+	if missing_accounts or missing_categories:
+		session.commit()
 
 
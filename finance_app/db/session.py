@@ -6,7 +6,7 @@ for database operations. It handles SQLite database creation and connection mana
 
 Key Functions:
 - get_default_db_path(): Get the default database file path
-- create_sqlite_engine(): Create SQLAlchemy engine for SQLite
+- create_sqlite_engine(): Create SQLAlchemy engine for SQLite (WAL mode, tuned PRAGMAs, pooled connections)
 - create_session_factory(): Create session factory for database operations
 """
 
@@ -15,13 +15,33 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
 
 
 # Default database filename
 DEFAULT_DB_FILENAME = "finance_app.db"
 
+# PRAGMAs applied to every new SQLite connection
+SQLITE_PRAGMAS = (
+	"journal_mode=WAL",        # Readers don't block the writer during imports
+	"synchronous=NORMAL",      # Safe with WAL; avoids an fsync on every commit
+	"mmap_size=268435456",     # Memory-map up to 256 MB of the database file
+	"temp_store=MEMORY",       # Keep temp tables/indices for sorts in memory
+	"cache_size=-65536",       # 64 MB page cache
+)
+
+# PRAGMAs that only apply to file-backed databases (skipped for :memory:)
+FILE_ONLY_PRAGMAS = ("journal_mode", "mmap_size")
+
+# Connection pool for file-backed databases: with WAL, UI threads can keep
+# reading on pooled connections while an import holds the single writer
+SQLITE_POOL_SIZE = 5
+SQLITE_MAX_OVERFLOW = 2
+# Seconds a connection waits on a locked database before raising
+SQLITE_BUSY_TIMEOUT = 30
+
 
 def get_default_db_path() -> Path:
 	"""
@@ -48,18 +68,51 @@ def create_sqlite_engine(db_path: Optional[Path] = None):
 		- `check_same_thread=False` allows cross-thread database access
 		- `echo=False` disables SQL query logging for performance
 		- `future=True` enables SQLAlchemy 2.0 features
+		- SQLITE_PRAGMAS are applied on every new connection
+		- File databases use a QueuePool (SQLITE_POOL_SIZE connections kept
+		  open); ":memory:" shares one connection across threads via StaticPool,
+		  since every new connection to it would be a separate, empty database
 	"""
 	path = db_path or get_default_db_path()
+	pool_args = dict(poolclass=StaticPool)
+	if str(path) != ":memory:":
+		pool_args = dict(
+			poolclass=QueuePool,
+			pool_size=SQLITE_POOL_SIZE,
+			max_overflow=SQLITE_MAX_OVERFLOW,
+		)
 	# `check_same_thread` disabled for potential use across threads in UI tasks
 	engine = create_engine(
 		f"sqlite:///{path}", 
 		echo=False, 
 		future=True, 
-		connect_args={"check_same_thread": False}
+		connect_args={"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT},
+		**pool_args
 	)
+	event.listen(engine, "connect", _apply_sqlite_pragmas)
 	return engine
 
 
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+	"""
+	Apply SQLITE_PRAGMAS to a freshly opened DBAPI connection.
+	
+	Args:
+		dbapi_connection: Raw sqlite3 connection
+		connection_record: Pool connection record (unused)
+	"""
+	cursor = dbapi_connection.cursor()
+	try:
+		# In-memory databases report an empty file name for "main"
+		in_memory = not cursor.execute("PRAGMA database_list").fetchone()[2]
+		for pragma in SQLITE_PRAGMAS:
+			if in_memory and pragma.startswith(FILE_ONLY_PRAGMAS):
+				continue
+			cursor.execute(f"PRAGMA {pragma}")
+	finally:
+		cursor.close()
+
+
 def create_session_factory(engine):
 	"""
 	Create a session factory for database operations.
@@ -8,14 +8,15 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from PySide6.QtWidgets import QApplication
-from finance_app.views.main_window import MainWindow
 from finance_app.db.init_db import init_db, seed_minimal
 from finance_app.db.context import set_session_factory
 
 
 def main():
 	"""Launch the modernized finance app."""
+	from PySide6.QtWidgets import QApplication
+	from finance_app.views.main_window import MainWindow
+
 	app = QApplication(sys.argv)
 	
 	# Initialize database
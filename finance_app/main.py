@@ -16,13 +16,9 @@ import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import sys
-from pathlib import Path
-
-from PySide6.QtWidgets import QApplication
 
 from finance_app.db.init_db import init_db, seed_minimal
 from finance_app.db.context import set_session_factory
-from finance_app.views.main_window import MainWindow
 
 
 def main() -> int:
@@ -34,6 +30,10 @@ def main() -> int:
 	Returns:
 		int: Application exit code (0 for success)
 	"""
+	# Qt and the views are imported here so importing this module stays cheap
+	from PySide6.QtWidgets import QApplication
+	from finance_app.views.main_window import MainWindow
+
 	# Create Qt application instance
 	app = QApplication(sys.argv)
 
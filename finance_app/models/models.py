@@ -22,12 +22,17 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import Optional
 
-from sqlalchemy import String, Date, DateTime, Numeric, ForeignKey, UniqueConstraint, CheckConstraint
+from sqlalchemy import String, Date, DateTime, Numeric, ForeignKey, UniqueConstraint, CheckConstraint, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import IdentifiedBase
 
 
+# Money columns: NUMERIC(14, 2) in the schema, returned as plain floats so
+# reports and the rules engine don't convert a Decimal for every row
+Money = Numeric(14, 2, asdecimal=False)
+
+
 class Account(IdentifiedBase):
 	"""
 	Chart of accounts for double-entry bookkeeping.
@@ -106,7 +111,7 @@ class Transaction(IdentifiedBase):
 	# Original description from bank statement
 	description: Mapped[str] = mapped_column(String(255), nullable=False)
 	# Transaction amount (positive = income, negative = expense)
-	amount: Mapped[float] = mapped_column(Numeric(14, 2), nullable=False)
+	amount: Mapped[float] = mapped_column(Money, nullable=False)
 	# Bank account where transaction occurred
 	source_account_id: Mapped[int] = mapped_column(ForeignKey("accounts.id"), nullable=False)
 	# Cleaned/standardized description for better matching
@@ -120,6 +125,14 @@ class Transaction(IdentifiedBase):
 	# Double-entry postings for this transaction
 	postings: Mapped[list["Posting"]] = relationship(back_populates="transaction", cascade="all, delete-orphan")
 
+	# Indexes for report queries
+	__table_args__ = (
+		# Date-range filters; amount included so cashflow/reconciliation sums are index-only
+		Index("ix_transactions_date_amount", "date", "amount"),
+		# Category breakdowns and uncategorized counts within a date range
+		Index("ix_transactions_category_date", "category_id", "date"),
+	)
+
 
 class Posting(IdentifiedBase):
 	"""
@@ -146,11 +159,11 @@ class Posting(IdentifiedBase):
 	# Associated transaction
 	transaction_id: Mapped[int] = mapped_column(ForeignKey("transactions.id"), nullable=False, index=True)
 	# Account being debited or credited
-	account_id: Mapped[int] = mapped_column(ForeignKey("accounts.id"), nullable=False)
+	account_id: Mapped[int] = mapped_column(ForeignKey("accounts.id"), nullable=False, index=True)
 	# Debit amount (increases assets/expenses, decreases liabilities/income)
-	debit: Mapped[float] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+	debit: Mapped[float] = mapped_column(Money, nullable=False, default=0)
 	# Credit amount (decreases assets/expenses, increases liabilities/income)
-	credit: Mapped[float] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+	credit: Mapped[float] = mapped_column(Money, nullable=False, default=0)
 
 	# Relationships
 	transaction: Mapped["Transaction"] = relationship(back_populates="postings")
@@ -190,9 +203,9 @@ class Rule(IdentifiedBase):
 	# Category to assign when pattern matches
 	category_id: Mapped[int] = mapped_column(ForeignKey("categories.id"), nullable=False)
 	# Optional minimum amount filter
-	amount_min: Mapped[Optional[float]] = mapped_column(Numeric(14, 2), nullable=True)
+	amount_min: Mapped[Optional[float]] = mapped_column(Money, nullable=True)
 	# Optional maximum amount filter
-	amount_max: Mapped[Optional[float]] = mapped_column(Numeric(14, 2), nullable=True)
+	amount_max: Mapped[Optional[float]] = mapped_column(Money, nullable=True)
 	# Rule priority (lower number = higher priority)
 	priority: Mapped[int] = mapped_column(nullable=False, default=100)
 	# Whether rule is currently active
@@ -9,11 +9,13 @@ Key Features:
 - Automatic posting generation for income and expense transactions
 - Balanced double-entry bookkeeping (total debits = total credits)
 - Dynamic account creation based on transaction categories
-- Batch processing for performance
+- Batch processing for performance (accounts/categories preloaded once per batch)
 
 Key Functions:
+- build_posting_rows(): Build the two balanced posting rows for a transaction
 - generate_postings_for_transaction(): Create postings for a single transaction
 - generate_all_postings(): Create postings for all uncategorized transactions
+- load_account_map() / load_category_names(): Preload lookups shared across a batch
 
 Double-Entry Rules:
 - Expenses: Credit source account (money out), Debit expense account
@@ -23,24 +25,86 @@ Double-Entry Rules:
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import load_only, raiseload
 
 from finance_app.models import models as m
+from finance_app.services.reports import mark_postings_changed
+
+
+# Number of posting rows sent per bulk INSERT
+POSTING_BATCH_SIZE = 5000
 
 
-def generate_postings_for_transaction(session, transaction: m.Transaction) -> int:
+def load_account_map(session) -> Dict[str, m.Account]:
 	"""
-	Generate double-entry postings for a single transaction.
+	Load all accounts keyed by name.
 	
-	Creates balanced debit/credit postings according to double-entry bookkeeping
-	principles. Each transaction generates exactly 2 postings that must balance.
+	Args:
+		session: Database session for operations
+		
+	Returns:
+		Dict[str, Account]: Accounts keyed by account name
+	"""
+	return {account.name: account for account in session.query(m.Account).all()}
+
+
+def load_category_names(session) -> Dict[int, str]:
+	"""
+	Load all category names keyed by category ID.
 	
 	Args:
 		session: Database session for operations
-		transaction (Transaction): Transaction to generate postings for
 		
 	Returns:
-		int: Number of postings created (always 2)
+		Dict[int, str]: Category names keyed by category ID
+	"""
+	return dict(session.query(m.Category.id, m.Category.name).all())
+
+
+def _get_or_create_account(session, accounts: Dict[str, m.Account], name: str, type_: str) -> m.Account:
+	"""
+	Look up an account in the preloaded map, creating it if it doesn't exist yet.
+	
+	Args:
+		session: Database session for operations
+		accounts (Dict[str, Account]): Preloaded account map, updated in place
+		name (str): Account name
+		type_ (str): Account type used if the account has to be created
+		
+	Returns:
+		Account: Existing or newly created account
+	"""
+	account = accounts.get(name)
+	if account is None:
+		account = m.Account(name=name, type=type_)
+		session.add(account)
+		session.flush()  # Flush to get the ID
+		accounts[name] = account
+	return account
+
+
+def build_posting_rows(
+	session,
+	transaction: m.Transaction,
+	accounts: Dict[str, m.Account],
+	category_names: Dict[int, str],
+) -> List[dict]:
+	"""
+	Build the balanced debit/credit posting rows for a transaction.
+	
+	Rows are plain mappings suitable for bulk insertion. Missing category
+	accounts are created (and added to `accounts`) along the way.
+	
+	Args:
+		session: Database session for operations
+		transaction (Transaction): Transaction to build postings for
+		accounts (Dict[str, Account]): Preloaded account map (see load_account_map)
+		category_names (Dict[int, str]): Preloaded category names (see load_category_names)
+		
+	Returns:
+		List[dict]: Exactly 2 posting rows (one debit, one credit)
 		
 	Posting Logic:
 		For Expenses (amount < 0):
@@ -50,41 +114,29 @@ def generate_postings_for_transaction(session, transaction: m.Transaction) -> in
 		For Income (amount > 0):
 			- Debit source account (money into bank)
 			- Credit income account (increase income)
-			
-	Note:
-		This function clears any existing postings for the transaction before
-		creating new ones, ensuring no duplicate postings.
 	"""
-	# Clear any existing postings for this transaction
-	session.query(m.Posting).filter(m.Posting.transaction_id == transaction.id).delete()
-	
 	# Determine if this is an expense or income based on amount sign
 	if transaction.amount < 0:
 		# EXPENSE TRANSACTION (money going out)
 		# Get or create expense account
 		if transaction.category_id:
 			# Use category-specific expense account
-			category = session.get(m.Category, transaction.category_id)
-			expense_account = session.query(m.Account).filter_by(name=f"Expense:{category.name}").first()
-			if not expense_account:
-				# Create new category-specific expense account
-				expense_account = m.Account(name=f"Expense:{category.name}", type="expense")
-				session.add(expense_account)
-				session.flush()  # Flush to get the ID
+			category_name = category_names[transaction.category_id]
+			expense_account = _get_or_create_account(session, accounts, f"Expense:{category_name}", "expense")
 		else:
 			# Use general expense account for uncategorized transactions
-			expense_account = session.query(m.Account).filter_by(name="Expenses").first()
+			expense_account = _get_or_create_account(session, accounts, "Expenses", "expense")
 		
 		# Create balanced postings for expense
 		# Posting 1: Credit source account (money out of bank)
-		posting1 = m.Posting(
+		posting1 = dict(
 			transaction_id=transaction.id,
 			account_id=transaction.source_account_id,
 			debit=0,
 			credit=abs(transaction.amount)  # Credit the bank account
 		)
 		# Posting 2: Debit expense account (increase expense)
-		posting2 = m.Posting(
+		posting2 = dict(
 			transaction_id=transaction.id,
 			account_id=expense_account.id,
 			debit=abs(transaction.amount),  # Debit the expense account
@@ -95,39 +147,71 @@ def generate_postings_for_transaction(session, transaction: m.Transaction) -> in
 		# Get or create income account
 		if transaction.category_id:
 			# Use category-specific income account
-			category = session.get(m.Category, transaction.category_id)
-			income_account = session.query(m.Account).filter_by(name=f"Income:{category.name}").first()
-			if not income_account:
-				# Create new category-specific income account
-				income_account = m.Account(name=f"Income:{category.name}", type="income")
-				session.add(income_account)
-				session.flush()  # Flush to get the ID
+			category_name = category_names[transaction.category_id]
+			income_account = _get_or_create_account(session, accounts, f"Income:{category_name}", "income")
 		else:
 			# Use general income account for uncategorized transactions
-			income_account = session.query(m.Account).filter_by(name="Income").first()
+			income_account = _get_or_create_account(session, accounts, "Income", "income")
 		
 		# Create balanced postings for income
 		# Posting 1: Debit source account (money into bank)
-		posting1 = m.Posting(
+		posting1 = dict(
 			transaction_id=transaction.id,
 			account_id=transaction.source_account_id,
 			debit=abs(transaction.amount),  # Debit the bank account
 			credit=0
 		)
 		# Posting 2: Credit income account (increase income)
-		posting2 = m.Posting(
+		posting2 = dict(
 			transaction_id=transaction.id,
 			account_id=income_account.id,
 			debit=0,
 			credit=abs(transaction.amount)  # Credit the income account
 		)
 	
-	# Add both postings to the session
-	session.add(posting1)
-	session.add(posting2)
+	return [posting1, posting2]
+
+
+def generate_postings_for_transaction(
+	session,
+	transaction: m.Transaction,
+	accounts: Optional[Dict[str, m.Account]] = None,
+	category_names: Optional[Dict[int, str]] = None,
+) -> int:
+	"""
+	Generate double-entry postings for a single transaction.
+	
+	Creates balanced debit/credit postings according to double-entry bookkeeping
+	principles. Each transaction generates exactly 2 postings that must balance.
+	See build_posting_rows() for the posting logic.
+	
+	Args:
+		session: Database session for operations
+		transaction (Transaction): Transaction to generate postings for
+		accounts (Optional[Dict[str, Account]]): Preloaded account map (see load_account_map)
+		category_names (Optional[Dict[int, str]]): Preloaded category names (see load_category_names)
+		
+	Returns:
+		int: Number of postings created (always 2)
+			
+	Note:
+		This function clears any existing postings for the transaction before
+		creating new ones, ensuring no duplicate postings.
+	"""
+	if accounts is None:
+		accounts = load_account_map(session)
+	if category_names is None:
+		category_names = load_category_names(session)
+
+	# Clear any existing postings for this transaction
+	session.query(m.Posting).filter(m.Posting.transaction_id == transaction.id).delete()
+	
+	rows = build_posting_rows(session, transaction, accounts, category_names)
+	session.bulk_insert_mappings(m.Posting, rows)
+	mark_postings_changed(session)
 	
 	# Always return 2 (one debit, one credit)
-	return 2
+	return len(rows)
 
 
 def generate_all_postings(session, limit: int = 10000) -> int:
@@ -147,22 +231,47 @@ def generate_all_postings(session, limit: int = 10000) -> int:
 	Note:
 		Only processes transactions that don't already have postings.
 		This function is idempotent - running it multiple times won't create duplicates.
+		It runs in the caller's transaction and never commits; call it inside
+		session_scope() so the whole batch is written with a single commit.
 	"""
 	count = 0
 	
-	# Find transactions without postings using LEFT JOIN
+	# Find transactions without postings using NOT EXISTS, which probes the
+	# postings.transaction_id index once per transaction instead of joining
+	has_postings = session.query(m.Posting.id).filter(m.Posting.transaction_id == m.Transaction.id).exists()
+	# Load just the columns build_posting_rows reads; category names come from
+	# the preloaded map, so relationships are never needed and raise if touched
 	transactions = (
 		session.query(m.Transaction)
-		.outerjoin(m.Posting, m.Transaction.id == m.Posting.transaction_id)
-		.filter(m.Posting.id.is_(None))  # No postings exist
+		.options(
+			load_only(
+				m.Transaction.amount,
+				m.Transaction.source_account_id,
+				m.Transaction.category_id,
+			),
+			raiseload("*"),
+		)
+		.filter(~has_postings)
 		.limit(limit)
 		.all()
 	)
 	
-	# Generate postings for each transaction
+	# Preload accounts and categories once for the whole batch
+	accounts = load_account_map(session)
+	category_names = load_category_names(session)
+	
+	# Build posting rows for every transaction, then insert them in bulk.
+	# The transactions were selected for having no postings, so there is
+	# nothing to clear first.
+	rows: List[dict] = []
 	for txn in transactions:
-		generate_postings_for_transaction(session, txn)
+		rows.extend(build_posting_rows(session, txn, accounts, category_names))
 		count += 1
 	
+	for start in range(0, len(rows), POSTING_BATCH_SIZE):
+		session.bulk_insert_mappings(m.Posting, rows[start:start + POSTING_BATCH_SIZE])
+	if rows:
+		mark_postings_changed(session)
+	
 	return count
 
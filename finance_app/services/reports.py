@@ -1,44 +1,111 @@
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
-from typing import Dict, List, Tuple
-from collections import defaultdict
+from datetime import date
+from typing import Any, Callable, Dict, List, Tuple
+from weakref import WeakKeyDictionary
 
-from sqlalchemy import func
+from sqlalchemy import Integer, case, cast, event, func, or_, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
 
 from finance_app.models import models as m
 
 
+# Account names counted as cash by get_cash_balance_total()
+CASH_ACCOUNT_KEYWORDS = ("Checking", "Savings")
+
+# Bumped each time a commit writes postings; balance reports reuse their last
+# result until this changes instead of re-aggregating the postings table.
+# Results are kept per engine, so switching databases in-process (another
+# init_db() path, or a fresh :memory: database whose URL is the same) never
+# returns another database's balances.
+_postings_version = 0
+_postings_cache: WeakKeyDictionary[Engine, Dict[str, Tuple[int, Any]]] = WeakKeyDictionary()
+
+
+def mark_postings_changed(session) -> None:
+	"""
+	Flag that `session` has written postings.
+	
+	The cached balance reports are invalidated once the session commits;
+	a rollback discards the flag.
+	
+	Args:
+		session: Database session that inserted or deleted postings
+	"""
+	session.info['postings_changed'] = True
+
+
+@event.listens_for(Session, 'after_commit')
+def _bump_postings_version(session) -> None:
+	global _postings_version
+	if session.info.pop('postings_changed', False):
+		_postings_version += 1
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_postings_changed(session) -> None:
+	session.info.pop('postings_changed', None)
+
+
+def _cached_until_postings_change(session, key: str, compute: Callable[[], Any]) -> Any:
+	"""
+	Return the cached result for `key`, computing it if postings changed since.
+	
+	Args:
+		session: Database session the report reads from (its engine scopes the cache)
+		key (str): Cache key (one per report)
+		compute (Callable[[], Any]): Computes the report
+		
+	Returns:
+		Any: Cached or freshly computed result
+	"""
+	version = _postings_version
+	cache = _postings_cache.setdefault(session.get_bind().engine, {})
+	cached = cache.get(key)
+	if cached is not None and cached[0] == version:
+		return cached[1]
+	result = compute()
+	cache[key] = (version, result)
+	return result
+
+
 def get_cashflow_by_month(session, start_date: date, end_date: date) -> List[Dict]:
 	"""
 	Get cashflow aggregated by month.
 	Returns list of {month, income, expenses, net}
 	"""
-	results = (
-		session.query(
-			func.strftime('%Y-%m', m.Transaction.date).label('month'),
+	# Group on an integer YYYYMM key cut straight from the stored ISO date
+	# text, rather than formatting every row's date with strftime
+	month_key = (
+		cast(func.substr(m.Transaction.date, 1, 4), Integer) * 100
+		+ cast(func.substr(m.Transaction.date, 6, 2), Integer)
+	).label('month_key')
+	stmt = (
+		select(
+			month_key,
 			func.sum(
-				func.case(
+				case(
 					(m.Transaction.amount > 0, m.Transaction.amount),
 					else_=0
 				)
 			).label('income'),
 			func.sum(
-				func.case(
+				case(
 					(m.Transaction.amount < 0, func.abs(m.Transaction.amount)),
 					else_=0
 				)
 			).label('expenses')
 		)
-		.filter(m.Transaction.date.between(start_date, end_date))
-		.group_by('month')
-		.order_by('month')
-		.all()
+		.where(m.Transaction.date.between(start_date, end_date))
+		.group_by(month_key)
+		.order_by(month_key)
 	)
+	results = session.execute(stmt).all()
 	
 	return [
 		{
-			'month': r.month,
+			'month': f"{r.month_key // 100:04d}-{r.month_key % 100:02d}",
 			'income': float(r.income or 0),
 			'expenses': float(r.expenses or 0),
 			'net': float(r.income or 0) - float(r.expenses or 0)
@@ -52,18 +119,19 @@ def get_category_breakdown(session, start_date: date, end_date: date) -> List[Di
 	Get expenses by category for a date range.
 	Returns list of {category, amount}
 	"""
-	results = (
-		session.query(
+	stmt = (
+		select(
 			m.Category.name.label('category'),
 			func.sum(func.abs(m.Transaction.amount)).label('amount')
 		)
+		.select_from(m.Transaction)
 		.join(m.Category, m.Transaction.category_id == m.Category.id)
-		.filter(m.Transaction.date.between(start_date, end_date))
-		.filter(m.Transaction.amount < 0)  # Only expenses
+		.where(m.Transaction.date.between(start_date, end_date))
+		.where(m.Transaction.amount < 0)  # Only expenses
 		.group_by(m.Category.name)
 		.order_by(func.sum(func.abs(m.Transaction.amount)).desc())
-		.all()
 	)
+	results = session.execute(stmt).all()
 	
 	return [
 		{'category': r.category, 'amount': float(r.amount or 0)}
@@ -73,28 +141,81 @@ def get_category_breakdown(session, start_date: date, end_date: date) -> List[Di
 
 def get_uncategorized_count(session) -> int:
 	"""Get count of transactions without a category."""
-	return session.query(m.Transaction).filter(m.Transaction.category_id.is_(None)).count()
+	# Plain COUNT over the category index; Query.count() would wrap a
+	# SELECT of every Transaction column in a subquery
+	stmt = select(func.count()).select_from(m.Transaction).where(m.Transaction.category_id.is_(None))
+	return session.scalar(stmt)
+
+
+def get_dashboard_stats(session) -> Dict:
+	"""
+	Get the dashboard's summary numbers.
+	Returns {uncategorized, transactions, cash_balance}
+	
+	Both transaction counts come from one aggregate query; the cash balance
+	comes from get_cash_balance_total, which is cached until postings change.
+	"""
+	counts = session.execute(
+		select(
+			func.count().filter(m.Transaction.category_id.is_(None)).label('uncategorized'),
+			func.count().label('transactions')
+		)
+		.select_from(m.Transaction)
+	).one()
+	
+	return {
+		'uncategorized': counts.uncategorized,
+		'transactions': counts.transactions,
+		'cash_balance': get_cash_balance_total(session)
+	}
 
 
 def get_account_balances(session) -> List[Dict]:
 	"""
 	Get current balance for each account based on postings.
 	Returns list of {account, balance}
+	
+	The result is cached until postings are committed again (see
+	mark_postings_changed), so repeated dashboard refreshes don't rescan
+	the postings table.
 	"""
-	results = (
-		session.query(
-			m.Account.name.label('account'),
-			(func.sum(m.Posting.debit) - func.sum(m.Posting.credit)).label('balance')
+	def compute() -> List[Dict]:
+		results = (
+			session.query(
+				m.Account.name.label('account'),
+				(func.sum(m.Posting.debit) - func.sum(m.Posting.credit)).label('balance')
+			)
+			.join(m.Posting, m.Account.id == m.Posting.account_id)
+			.group_by(m.Account.name)
+			.all()
 		)
-		.join(m.Posting, m.Account.id == m.Posting.account_id)
-		.group_by(m.Account.name)
-		.all()
-	)
+		return [
+			{'account': r.account, 'balance': float(r.balance or 0)}
+			for r in results
+		]
 	
-	return [
-		{'account': r.account, 'balance': float(r.balance or 0)}
-		for r in results
-	]
+	# Copy the rows so callers can't modify the cached result
+	return [dict(row) for row in _cached_until_postings_change(session, 'account_balances', compute)]
+
+
+def get_cash_balance_total(session) -> float:
+	"""
+	Get the combined balance of cash accounts (see CASH_ACCOUNT_KEYWORDS).
+	
+	Filters and sums in SQL, returning a single row. Like
+	get_account_balances, the result is cached until postings change.
+	"""
+	def compute() -> float:
+		# instr() rather than LIKE: account names are matched case-sensitively
+		is_cash = or_(*(func.instr(m.Account.name, keyword) > 0 for keyword in CASH_ACCOUNT_KEYWORDS))
+		total = session.scalar(
+			select(func.sum(m.Posting.debit) - func.sum(m.Posting.credit))
+			.join(m.Account, m.Account.id == m.Posting.account_id)
+			.where(is_cash)
+		)
+		return float(total or 0)
+	
+	return _cached_until_postings_change(session, 'cash_balance_total', compute)
 
 
 def get_reconciliation_report(session, period_start: date, period_end: date) -> Dict:
@@ -102,15 +223,19 @@ def get_reconciliation_report(session, period_start: date, period_end: date) ->
 	Generate reconciliation report for a period.
 	Returns {opening_balance, inflows, outflows, closing_balance, transaction_count}
 	"""
-	# Get transactions in period
-	transactions = (
-		session.query(m.Transaction)
+	# Aggregate the period in SQL rather than loading every transaction
+	totals = (
+		session.query(
+			func.coalesce(func.sum(case((m.Transaction.amount > 0, m.Transaction.amount), else_=0)), 0).label('inflows'),
+			func.coalesce(func.sum(case((m.Transaction.amount < 0, func.abs(m.Transaction.amount)), else_=0)), 0).label('outflows'),
+			func.count(m.Transaction.id).label('transaction_count')
+		)
 		.filter(m.Transaction.date.between(period_start, period_end))
-		.all()
+		.one()
 	)
 	
-	inflows = sum(float(t.amount) for t in transactions if t.amount > 0)
-	outflows = sum(abs(float(t.amount)) for t in transactions if t.amount < 0)
+	inflows = float(totals.inflows)
+	outflows = float(totals.outflows)
 	
 	# For simplicity, assume opening balance is 0 for now
 	# In a real app, you'd calculate from prior period
@@ -124,6 +249,6 @@ def get_reconciliation_report(session, period_start: date, period_end: date) ->
 		'inflows': inflows,
 		'outflows': outflows,
 		'closing_balance': closing_balance,
-		'transaction_count': len(transactions)
+		'transaction_count': totals.transaction_count
 	}
 
@@ -6,7 +6,10 @@ transactions based on description patterns and optional amount ranges. Rules are
 evaluated in priority order, and the first matching rule is applied.
 
 Key Features:
-- Regex pattern matching on transaction descriptions
+- Regex pattern matching on transaction descriptions (linear-time RE2 when
+  google-re2 is installed, JIT-compiled PCRE2 for patterns RE2 can't handle
+  when pcre2 is installed, Python's `re` otherwise)
+- Single-pass multi-pattern scanning with Hyperscan when installed (ASCII text)
 - Optional amount range filtering (min/max)
 - Priority-based rule evaluation
 - Dry-run capability to preview matches
@@ -14,19 +17,104 @@ Key Features:
 
 Key Functions:
 - RuleMatch: Data class for rule match results
-- _rule_matches(): Check if a rule matches a transaction
+- _compile_pattern(): Compile (and cache) a rule's regex pattern
+- _compile_fallback(): Compile a pattern with `re` semantics (PCRE2 or re)
+- _compile_rule(): Build a match function specialized to a rule
+- _combine_patterns(): Union all rule patterns into a single first-match lookup
+- _combine_with_re() / _combine_with_re2() / _combine_with_hyperscan(): Backends for it
+- _first_matching_rule(): Find the highest-priority rule matching a transaction
+- _load_rules(): Fetch active rules, reusing the compiled set while they're unchanged
+- _iter_uncategorized(): Page through uncategorized transactions by ID
+- assign_categories(): Bulk-update transactions' categories
 - dry_run_matches(): Preview rule matches without applying
 - apply_rules(): Apply rules to categorize transactions
 """
 
 from __future__ import annotations
 
+import math
 import re
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import Row, select, update
 
 from finance_app.models import models as m
 
+try:
+	import re2
+	RE2_AVAILABLE = True
+except ImportError:
+	RE2_AVAILABLE = False
+	re2 = None
+
+try:
+	import pcre2
+	PCRE2_AVAILABLE = True
+except ImportError:
+	PCRE2_AVAILABLE = False
+	pcre2 = None
+
+try:
+	import hyperscan
+	HYPERSCAN_AVAILABLE = True
+except ImportError:
+	HYPERSCAN_AVAILABLE = False
+	hyperscan = None
+
+
+# Backreferences and conditional group references ("(?(1)yes|no)") would
+# point at the wrong group once patterns are combined
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+# Patterns containing none of these are plain substrings (e.g. "AMAZON")
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+# RE2 matches in linear time, so one pathological rule pattern can't stall a
+# rules pass. It doesn't support backreferences or lookaround; patterns it
+# rejects are compiled with `re` instead. RE2's \d, \w and \b are ASCII-only,
+# so it is only used on ASCII descriptions (others use the fallback matcher).
+# Its $ doesn't match before a trailing newline and its \s leaves out \v, on
+# any text, so patterns using them never go to RE2.
+_RE2_UNSAFE = re.compile(r"\$|\\[sS]")
+if RE2_AVAILABLE:
+	_RE2_OPTIONS = re2.Options()
+	_RE2_OPTIONS.case_sensitive = False
+	_RE2_OPTIONS.log_errors = False
+
+# PCRE2 compiles patterns to machine code (JIT) once, at rule load. It runs
+# patterns RE2 rejects and is used instead of `re` when RE2 isn't installed.
+# UTF mode so case-insensitive matching covers non-ASCII letters like `re`.
+if PCRE2_AVAILABLE:
+	_PCRE2_FLAGS = pcre2.IGNORECASE | pcre2.UNICODE
+
+# Hyperscan flags for rule patterns: case-insensitive, one report per
+# pattern, and allowing patterns such as "x*" that match anywhere
+if HYPERSCAN_AVAILABLE:
+	_HYPERSCAN_FLAGS = (
+		hyperscan.HS_FLAG_CASELESS
+		| hyperscan.HS_FLAG_SINGLEMATCH
+		| hyperscan.HS_FLAG_ALLOWEMPTY
+	)
+
+# A compiled rule pattern: a lowercase literal or a compiled regex
+Matcher = Union[str, re.Pattern, "re2._Regexp", "pcre2.Pattern"]
+
+# Checks (description, lowercased description, amount) against one rule
+RuleCheck = Callable[[str, str, float], bool]
+
+# Given a description, returns the index of the first rule whose pattern
+# matches it, or None
+FirstMatch = Callable[[str], Optional[int]]
+
+# Maximum number of transaction IDs per bulk UPDATE (SQLite bound parameter limit)
+UPDATE_BATCH_SIZE = 1000
+
+# Rule columns read for matching; a rule is carried as one of these rows
+_RULE_COLUMNS = (m.Rule.id, m.Rule.pattern, m.Rule.category_id, m.Rule.amount_min, m.Rule.amount_max)
+
 
 @dataclass
 class RuleMatch:
@@ -46,43 +134,346 @@ class RuleMatch:
 	category_id: int
 
 
-def _rule_matches(rule: m.Rule, description: str, amount: float) -> bool:
+@lru_cache(maxsize=500)
+def _compile_pattern(pattern: str) -> Matcher:
 	"""
-	Check if a rule matches a transaction.
+	Compile a rule pattern for case-insensitive matching.
 	
-	Evaluates a rule against a transaction's description and amount to determine
-	if the rule should be applied. Rules must be active and match all criteria.
+	ASCII patterns without regex metacharacters are kept as lowercase
+	literals and matched with a substring test, skipping the regex engine.
+	Anything else is compiled once (with RE2 if available and the pattern is
+	RE2-safe, else see _compile_fallback) and cached rather than looked up in
+	`re`'s internal cache for every transaction.
+	
+	Literal and RE2 matchers are only exact for ASCII descriptions (str.lower()
+	disagrees with `re`'s case-insensitive matching on 'İ', 'ı', 'ſ' and the
+	like); match other descriptions with _compile_fallback(pattern).
 	
 	Args:
-		rule (Rule): The rule to evaluate
-		description (str): Transaction description text
-		amount (float): Transaction amount
+		pattern (str): Regex pattern from a Rule
+		
+	Returns:
+		Matcher: Lowercase literal, or compiled pattern
+	"""
+	if pattern.isascii() and not _REGEX_METACHARACTERS.intersection(pattern):
+		return pattern.lower()
+	if RE2_AVAILABLE and not _RE2_UNSAFE.search(pattern):
+		try:
+			return re2.compile(pattern, _RE2_OPTIONS)
+		except re2.error:
+			pass  # Backreferences/lookaround: fall back to PCRE2 or re
+	return _compile_fallback(pattern)
+
+
+@lru_cache(maxsize=500)
+def _compile_fallback(pattern: str) -> Union[re.Pattern, "pcre2.Pattern"]:
+	"""
+	Compile a rule pattern with Unicode-aware semantics matching `re`.
+	
+	JIT-compiled PCRE2 if available, else `re`.
+	
+	Args:
+		pattern (str): Regex pattern from a Rule
+		
+	Returns:
+		Union[re.Pattern, pcre2.Pattern]: Compiled pattern
+	"""
+	if PCRE2_AVAILABLE:
+		try:
+			return pcre2.compile(pattern, flags=_PCRE2_FLAGS, jit=True)
+		except pcre2.error:
+			pass  # Python-only syntax: fall back to re
+	return re.compile(pattern, re.IGNORECASE)
+
+
+@dataclass
+class _CompiledRule:
+	"""
+	An active rule prepared for matching (see _compile_rule).
+	
+	Attributes:
+		rule (Row): The rule's _RULE_COLUMNS row
+		matcher (Matcher): Compiled pattern (see _compile_pattern)
+		amount_min (float): Lower amount bound (-inf if the rule has none)
+		amount_max (float): Upper amount bound (inf if the rule has none)
+		matches (RuleCheck): Full check of a transaction, specialized to this rule
+	"""
+	rule: Row
+	matcher: Matcher
+	amount_min: float
+	amount_max: float
+	matches: RuleCheck
+
+
+def _compile_rule(rule: Row) -> _CompiledRule:
+	"""
+	Prepare an active rule for matching.
+	
+	Builds a match function specialized to the rule: missing amount bounds
+	become -inf/inf so the range check is a single chained comparison, and
+	the pattern test is bound for its kind (substring or regex). The hot loop
+	then does no None checks, type dispatch or ORM attribute access.
+	
+	Args:
+		rule (Row): The rule's _RULE_COLUMNS row (must be active)
 		
 	Returns:
-		bool: True if rule matches, False otherwise
+		_CompiledRule: Compiled rule
 		
-	Criteria:
-		- Rule must be active
-		- Description must match regex pattern (case-insensitive)
+	Criteria checked by `matches`:
 		- Amount must be within min/max range (if specified)
+		- Description must match the pattern (case-insensitive)
 	"""
-	# Rule must be active
-	if not rule.active:
-		return False
+	matcher = _compile_pattern(rule.pattern)
+	lo = -math.inf if rule.amount_min is None else rule.amount_min
+	hi = math.inf if rule.amount_max is None else rule.amount_max
 	
-	# Check regex pattern match (case-insensitive)
-	if not re.search(rule.pattern, description, flags=re.IGNORECASE):
-		return False
+	# The amount range is checked first; it's far cheaper than the pattern
+	if isinstance(matcher, str):
+		fallback = _compile_fallback(rule.pattern).search
+		
+		def matches(description: str, description_lower: str, amount: float) -> bool:
+			if not lo <= amount <= hi:
+				return False
+			if description.isascii():
+				return matcher in description_lower
+			return fallback(description) is not None
+	elif RE2_AVAILABLE and isinstance(matcher, re2._Regexp):
+		search = matcher.search
+		fallback = _compile_fallback(rule.pattern).search
+		
+		def matches(description: str, description_lower: str, amount: float) -> bool:
+			if not lo <= amount <= hi:
+				return False
+			return (search if description.isascii() else fallback)(description) is not None
+	else:
+		search = matcher.search
+		
+		def matches(description: str, description_lower: str, amount: float) -> bool:
+			return lo <= amount <= hi and search(description) is not None
 	
-	# Check minimum amount constraint
-	if rule.amount_min is not None and amount < float(rule.amount_min):
-		return False
+	return _CompiledRule(rule, matcher, lo, hi, matches)
+
+
+def _combine_patterns(compiled: Sequence[_CompiledRule]) -> Optional[FirstMatch]:
+	"""
+	Union rule patterns into one lookup that finds the first matching rule.
 	
-	# Check maximum amount constraint
-	if rule.amount_max is not None and amount > float(rule.amount_max):
-		return False
+	All patterns go into one `re` pattern (see _combine_with_re). With RE2,
+	ASCII descriptions are matched against an RE2 set of the patterns in a
+	single linear-time pass instead (see _combine_with_re2); with Hyperscan,
+	against a database of all the patterns (see _combine_with_hyperscan).
 	
-	return True
+	Args:
+		compiled (Sequence[_CompiledRule]): Rules in priority order
+		
+	Returns:
+		Optional[FirstMatch]: Combined lookup, or None if the patterns can't be
+		combined safely (backreferences, conditional group references,
+		conflicting group names or inline flags)
+	"""
+	if not compiled:
+		return None
+	combined = _combine_with_re(compiled)
+	if RE2_AVAILABLE and combined is not None and all(isinstance(c.matcher, (str, re2._Regexp)) for c in compiled):
+		# Every pattern is RE2-compatible (literals always are)
+		combined = _combine_with_re2(compiled, combined) or combined
+	if HYPERSCAN_AVAILABLE and combined is not None:
+		combined = _combine_with_hyperscan(compiled, combined) or combined
+	return combined
+
+
+def _combine_with_re(compiled: Sequence[_CompiledRule]) -> Optional[FirstMatch]:
+	"""
+	Union the rule patterns into a single `re` pattern (see _combine_patterns).
+	
+	Each pattern becomes an alternative `(?=.*?(?:pattern))(?P<rN>)` (with `.`
+	also matching newlines) matched at the start of the description.
+	Alternatives are tried in order, so `lastgroup` names the highest-priority
+	rule whose pattern occurs anywhere in the text.
+	
+	Args:
+		compiled (Sequence[_CompiledRule]): Rules in priority order
+		
+	Returns:
+		Optional[FirstMatch]: Combined lookup, or None if the patterns can't be
+		combined safely
+	"""
+	if any(_BACKREFERENCE.search(c.rule.pattern) for c in compiled):
+		return None
+	parts = [
+		rf"(?=[\s\S]*?(?:{c.rule.pattern}))(?P<r{i}>)"
+		for i, c in enumerate(compiled)
+	]
+	try:
+		pattern = re.compile("|".join(parts), re.IGNORECASE)
+	except re.error:
+		return None
+	
+	def first_match(description: str) -> Optional[int]:
+		match = pattern.match(description)
+		return None if match is None else int(match.lastgroup[1:])
+	
+	return first_match
+
+
+def _combine_with_hyperscan(
+	compiled: Sequence[_CompiledRule],
+	fallback: FirstMatch,
+) -> Optional[FirstMatch]:
+	"""
+	Compile the rule patterns into a Hyperscan database (see _combine_patterns).
+	
+	The database works on bytes (Hyperscan's UTF-8 mode misses matches in
+	caseless multi-pattern databases), which is exact for ASCII text; other
+	descriptions go to `fallback`. Hyperscan reports every matching pattern
+	in one scan, and the lowest index is the winner.
+	
+	Args:
+		compiled (Sequence[_CompiledRule]): Rules in priority order
+		fallback (FirstMatch): Lookup for non-ASCII descriptions
+		
+	Returns:
+		Optional[FirstMatch]: Combined lookup, or None if Hyperscan rejects a
+		pattern (backreferences, lookaround)
+	"""
+	database = hyperscan.Database()
+	try:
+		database.compile(
+			expressions=[c.rule.pattern.encode("utf-8") for c in compiled],
+			ids=list(range(len(compiled))),
+			elements=len(compiled),
+			flags=[_HYPERSCAN_FLAGS] * len(compiled),
+		)
+	except hyperscan.error:
+		return None
+	
+	def first_match(description: str) -> Optional[int]:
+		if not description.isascii():
+			return fallback(description)
+		matched: List[int] = []
+		
+		def on_match(pattern_id, start, end, flags, context):
+			matched.append(pattern_id)
+		
+		# Matches arrive in order of where they end, not by priority, so
+		# collect them all (at most one per pattern) and take the lowest
+		database.scan(description.encode("ascii"), match_event_handler=on_match)
+		return min(matched) if matched else None
+	
+	return first_match
+
+
+def _combine_with_re2(
+	compiled: Sequence[_CompiledRule],
+	fallback: FirstMatch,
+) -> Optional[FirstMatch]:
+	"""
+	Build an RE2 set over the rule patterns (see _combine_patterns).
+	
+	The set reports every matching pattern in a single linear-time pass, and
+	the lowest index is the winner. RE2's character classes are ASCII-only,
+	so non-ASCII descriptions go to `fallback`.
+	
+	Args:
+		compiled (Sequence[_CompiledRule]): Rules in priority order
+		fallback (FirstMatch): Lookup for non-ASCII descriptions
+		
+	Returns:
+		Optional[FirstMatch]: Combined lookup, or None if RE2 rejects the set
+	"""
+	patterns = re2.Set.SearchSet(_RE2_OPTIONS)
+	try:
+		for c in compiled:
+			patterns.Add(c.rule.pattern)
+	except re2.error:
+		return None
+	if not patterns.Compile():
+		return None
+	
+	def first_match(description: str) -> Optional[int]:
+		if not description.isascii():
+			return fallback(description)
+		matched = patterns.Match(description)
+		return min(matched) if matched else None
+	
+	return first_match
+
+
+def _first_matching_rule(
+	compiled: Sequence[_CompiledRule],
+	combined: Optional[FirstMatch],
+	description: str,
+	amount: float,
+) -> Optional[Row]:
+	"""
+	Find the highest-priority rule matching a transaction.
+	
+	Uses the combined pattern (see _combine_patterns) to skip straight to the
+	first rule whose pattern matches, or past all rules if none do. That rule
+	only needs its amount range checked; if the range rules it out, the
+	remaining rules are tried one by one.
+	
+	Args:
+		compiled (Sequence[_CompiledRule]): Rules in priority order
+		combined (Optional[FirstMatch]): Union of the rule patterns, if available
+		description (str): Transaction description text
+		amount (float): Transaction amount
+		
+	Returns:
+		Optional[Row]: First matching rule's row, or None
+	"""
+	start = 0
+	if combined is not None:
+		start = combined(description)
+		if start is None:
+			return None
+		# The combined match already proved this rule's pattern matches
+		first = compiled[start]
+		if first.amount_min <= amount <= first.amount_max:
+			return first.rule
+		start += 1
+	description_lower = description.lower()
+	for i in range(start, len(compiled)):
+		if compiled[i].matches(description, description_lower, amount):
+			return compiled[i].rule
+	return None
+
+
+# Last result of _load_rules: (active rule rows, their compiled rules, combined lookup)
+_rules_cache: Optional[Tuple[List[Row], List[_CompiledRule], Optional[FirstMatch]]] = None
+
+
+def _load_rules(session) -> Tuple[List[_CompiledRule], Optional[FirstMatch]]:
+	"""
+	Fetch the active rules in priority order, compiled for matching.
+	
+	The rule rows are read on every call (a handful of small rows), but they
+	are only recompiled and recombined when they differ from the last call's.
+	Building the combined lookup is the expensive part. Comparing the rows
+	themselves catches any change to the rules, however it was written.
+	
+	Args:
+		session: Database session for operations
+		
+	Returns:
+		Tuple[List[_CompiledRule], Optional[FirstMatch]]: Compiled rules (empty
+		if there are no active rules) and their combined lookup (see
+		_combine_patterns)
+	"""
+	global _rules_cache
+	rules = session.execute(
+		select(*_RULE_COLUMNS)
+		.where(m.Rule.active.is_(True))
+		.order_by(m.Rule.priority.asc())
+	).all()
+	cached = _rules_cache
+	if cached is not None and cached[0] == rules:
+		return cached[1], cached[2]
+	compiled = [_compile_rule(rule) for rule in rules]
+	combined = _combine_patterns(compiled)
+	_rules_cache = (rules, compiled, combined)
+	return compiled, combined
 
 
 def dry_run_matches(session, limit: int = 1000) -> List[RuleMatch]:
@@ -105,39 +496,98 @@ def dry_run_matches(session, limit: int = 1000) -> List[RuleMatch]:
 	"""
 	results: List[RuleMatch] = []
 	
-	# Get uncategorized transactions (most recent first)
-	transactions = (
-		session.query(m.Transaction)
-		.filter(m.Transaction.category_id.is_(None))
+	# Get active rules in priority order (compiled once while unchanged)
+	compiled, combined = _load_rules(session)
+	if not compiled:
+		# Nothing can match, so don't scan the transactions at all
+		return results
+	
+	# Get uncategorized transactions (most recent first); only the columns
+	# rule matching reads, so no Transaction objects are built
+	transactions = session.execute(
+		select(m.Transaction.id, m.Transaction.description, m.Transaction.amount)
+		.where(m.Transaction.category_id.is_(None))
 		.order_by(m.Transaction.date.desc())
 		.limit(limit)
-		.all()
-	)
-	
-	# Get active rules in priority order
-	rules = session.query(m.Rule).filter(m.Rule.active.is_(True)).order_by(m.Rule.priority.asc()).all()
+	).all()
 	
 	# Evaluate each transaction against rules
-	for txn in transactions:
-		for rule in rules:
-			if _rule_matches(rule, txn.description, float(txn.amount)):
-				# First matching rule wins (due to priority ordering)
-				results.append(RuleMatch(
-					transaction_id=txn.id, 
-					rule_id=rule.id, 
-					category_id=rule.category_id
-				))
-				break  # Stop at first match
+	for txn_id, description, amount in transactions:
+		# First matching rule wins (due to priority ordering)
+		rule = _first_matching_rule(compiled, combined, description, amount)
+		if rule is not None:
+			results.append(RuleMatch(
+				transaction_id=txn_id, 
+				rule_id=rule.id, 
+				category_id=rule.category_id
+			))
 	
 	return results
 
 
+def _iter_uncategorized(session, batch_size: int) -> Iterator[List[Row]]:
+	"""
+	Yield pages of uncategorized (id, description, amount) rows.
+	
+	Uses keyset pagination on `id` (each page starts after the last ID seen)
+	rather than one long-lived cursor, so memory stays flat and rows can be
+	updated between pages.
+	
+	Args:
+		session: Database session for operations
+		batch_size (int): Maximum rows per page
+		
+	Yields:
+		List[Row]: Next page of rows, in ID order
+	"""
+	last_id = 0
+	while True:
+		rows = session.execute(
+			select(m.Transaction.id, m.Transaction.description, m.Transaction.amount)
+			.where(m.Transaction.category_id.is_(None), m.Transaction.id > last_id)
+			.order_by(m.Transaction.id)
+			.limit(batch_size)
+		).all()
+		if not rows:
+			return
+		yield rows
+		last_id = rows[-1].id
+
+
+def assign_categories(session, matches: Dict[Optional[int], List[int]]) -> int:
+	"""
+	Write categories with one bulk UPDATE per category.
+	
+	Used for rule matches and for categories edited in the transactions view.
+	
+	Args:
+		session: Database session for operations
+		matches (Dict[Optional[int], List[int]]): Transaction IDs keyed by the
+			category ID to assign (None clears the category)
+		
+	Returns:
+		int: Number of transactions updated
+	"""
+	updated = 0
+	for category_id, ids in matches.items():
+		for start in range(0, len(ids), UPDATE_BATCH_SIZE):
+			result = session.execute(
+				update(m.Transaction)
+				.where(m.Transaction.id.in_(ids[start:start + UPDATE_BATCH_SIZE]))
+				.values(category_id=category_id)
+			)
+			updated += result.rowcount
+	return updated
+
+
 def apply_rules(session, batch_size: int = 1000) -> int:
 	"""
 	Apply rules to categorize uncategorized transactions.
 	
-	Processes uncategorized transactions in batches, applying the first matching
-	rule to each transaction. Uses batch processing for memory efficiency.
+	Processes uncategorized transactions a page at a time (keyset pagination
+	on ID), finding the first matching rule for each transaction. Each page's
+	matches are written with one bulk UPDATE per category rather than a
+	per-row ORM update.
 	
 	Args:
 		session: Database session for operations
@@ -153,22 +603,22 @@ def apply_rules(session, batch_size: int = 1000) -> int:
 	"""
 	updated = 0
 	
-	# Get active rules in priority order
-	rules = session.query(m.Rule).filter(m.Rule.active.is_(True)).order_by(m.Rule.priority.asc()).all()
-	
-	# Query for uncategorized transactions
-	q = session.query(m.Transaction).filter(m.Transaction.category_id.is_(None)).order_by(m.Transaction.date.asc())
+	# Get active rules in priority order (compiled once while unchanged)
+	compiled, combined = _load_rules(session)
+	if not compiled:
+		# Nothing can match, so don't scan the transactions at all
+		return updated
 	
-	# Process transactions in batches for memory efficiency
-	for txn in q.yield_per(batch_size):
-		# Try each rule in priority order
-		for rule in rules:
-			if _rule_matches(rule, txn.description, float(txn.amount)):
-				# Apply the first matching rule
-				txn.category_id = rule.category_id
-				updated += 1
-				break  # Stop at first match
+	# Process transactions a page at a time, writing each page's matches
+	# before fetching the next
+	for rows in _iter_uncategorized(session, batch_size):
+		# Matched transaction IDs grouped by the category to assign
+		matches: Dict[int, List[int]] = defaultdict(list)
+		for txn_id, description, amount in rows:
+			# Find the first matching rule in priority order
+			rule = _first_matching_rule(compiled, combined, description, amount)
+			if rule is not None:
+				matches[rule.category_id].append(txn_id)
+		updated += assign_categories(session, matches)
 	
 	return updated
-
-
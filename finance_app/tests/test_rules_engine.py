@@ -0,0 +1,38 @@
+"""Combined rule lookups must pick the same rule as matching rules one by one."""
+
+import itertools
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from finance_app.services import rules_engine
+
+# Patterns whose meaning depends on group numbers or names, next to plain ones
+PATTERNS = [
+	"(q)zz",
+	"(a)?(?(1)b|c)",
+	"(?P<x>d)?(?(x)e|f)",
+	"(g)\\1",
+	"(?P<h>h)(?P=h)",
+	"(uber|lyft)",
+	"coffee",
+	"^pay",
+]
+
+DESCRIPTIONS = ["ab", "c", "de", "f", "gg", "hh", "qzz", "Uber", "Coffee shop", "payroll", "zz", ""]
+
+
+def _rule(i, pattern):
+	return SimpleNamespace(id=i, pattern=pattern, category_id=i, amount_min=None, amount_max=None)
+
+
+@pytest.mark.parametrize("patterns", list(itertools.permutations(PATTERNS[:5], 2)) + [tuple(PATTERNS)])
+def test_combined_lookup_matches_per_rule(patterns):
+	rules = [_rule(i, p) for i, p in enumerate(patterns)]
+	compiled = [rules_engine._compile_rule(rule) for rule in rules]
+	combined = rules_engine._combine_patterns(compiled)
+	for description in DESCRIPTIONS:
+		expected = next((rule for rule in rules if re.search(rule.pattern, description, re.IGNORECASE)), None)
+		assert rules_engine._first_matching_rule(compiled, None, description, 0.0) is expected
+		assert rules_engine._first_matching_rule(compiled, combined, description, 0.0) is expected
@@ -4,18 +4,21 @@ Verification script to check all dependencies are installed correctly.
 Run this before starting the app for the first time.
 """
 
+import importlib.util
 import sys
 
 def check_import(module_name, package_name=None):
-    """Try to import a module and report status."""
+    """Check that a module is installed and report status.
+    
+    Uses find_spec so the module is located but not executed (importing
+    PySide6 or pandas just to check for them takes most of this script's time).
+    """
     package_name = package_name or module_name
-    try:
-        __import__(module_name)
+    if importlib.util.find_spec(module_name) is not None:
         print(f"✓ {package_name} installed")
         return True
-    except ImportError:
-        print(f"✗ {package_name} NOT installed")
-        return False
+    print(f"✗ {package_name} NOT installed")
+    return False
 
 def main():
     print("Finance App Installation Verification")
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 from datetime import date, timedelta
-from typing import List, Dict
 
+import numpy as np
 from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QFont, QPalette, QColor, QIcon
+from PySide6.QtCore import Qt, QThreadPool, QTimer
+from PySide6.QtGui import QFont
 
 try:
 	import pyqtgraph as pg
@@ -14,8 +14,12 @@ except ImportError:
 	CHARTS_AVAILABLE = False
 	pg = None
 
-from finance_app.db.context import session_scope
 from finance_app.services.reports import get_cashflow_by_month, get_category_breakdown
+from finance_app.views.workers import QueryWorker
+
+
+# Delay before reloading, so clicking through time ranges loads only the last one
+RELOAD_DEBOUNCE_MS = 150
 
 
 class ModernChartWindow(QMainWindow):
@@ -28,6 +32,15 @@ class ModernChartWindow(QMainWindow):
 		self.setMinimumSize(800, 600)
 		self.setStyleSheet(self.get_modern_style())
 		
+		# Single-shot timer restarted by each reload request (see schedule_load)
+		self._load_timer = QTimer(self)
+		self._load_timer.setSingleShot(True)
+		self._load_timer.timeout.connect(self.load_data)
+		# Signals of the latest load worker; results from older ones are dropped
+		self._pending_load = None
+		# Signals of every running worker, kept alive until it reports back
+		self._workers = set()
+		
 		# Central widget
 		central_widget = QWidget()
 		self.setCentralWidget(central_widget)
@@ -122,7 +135,7 @@ class ModernChartWindow(QMainWindow):
 				border-top: 5px solid #7f8c8d;
 			}
 		""")
-		self.time_combo.currentIndexChanged.connect(self.load_data)
+		self.time_combo.currentIndexChanged.connect(self.schedule_load)
 		layout.addWidget(self.time_combo)
 		
 		# Refresh button
@@ -146,7 +159,7 @@ class ModernChartWindow(QMainWindow):
 				background: #2980b9;
 			}
 		""")
-		refresh_btn.clicked.connect(self.load_data)
+		refresh_btn.clicked.connect(self.schedule_load)
 		layout.addWidget(refresh_btn)
 		
 		return header
@@ -221,33 +234,60 @@ class ModernChartWindow(QMainWindow):
 		
 		return start, end
 	
+	def schedule_load(self):
+		"""Reload chart data once no further request arrives within RELOAD_DEBOUNCE_MS."""
+		self._load_timer.start(RELOAD_DEBOUNCE_MS)
+
 	def load_data(self):
-		"""Load and display chart data."""
+		"""Query chart data on the thread pool; show_data draws it."""
 		if not CHARTS_AVAILABLE:
 			return
 		
+		if self.chart_type == "cashflow":
+			report = get_cashflow_by_month
+		elif self.chart_type == "categories":
+			report = get_category_breakdown
+		else:
+			return
+		
 		start, end = self.get_date_range()
+		worker = QueryWorker(lambda s: report(s, start, end))
+		worker.signals.finished.connect(self.show_data)
+		worker.signals.failed.connect(self.load_failed)
+		self._workers.add(worker.signals)
+		self._pending_load = worker.signals
+		QThreadPool.globalInstance().start(worker)
+	
+	def load_failed(self, error: Exception):
+		"""Drop a failed load worker; the chart keeps what it last drew."""
+		self._workers.discard(self.sender())
+	
+	def show_data(self, data: list):
+		"""Draw results from load_data (runs on the GUI thread)."""
+		sender = self.sender()
+		self._workers.discard(sender)
+		if sender is not self._pending_load:
+			return
 		
-		with session_scope() as s:
-			if self.chart_type == "cashflow":
-				self.load_cashflow_data(s, start, end)
-			elif self.chart_type == "categories":
-				self.load_category_data(s, start, end)
+		if self.chart_type == "cashflow":
+			self.load_cashflow_data(data)
+		elif self.chart_type == "categories":
+			self.load_category_data(data)
 	
-	def load_cashflow_data(self, session, start: date, end: date):
+	def load_cashflow_data(self, data: list):
 		"""Load cashflow data into chart."""
-		from finance_app.services.reports import get_cashflow_by_month
-		
-		data = get_cashflow_by_month(session, start, end)
 		if not data:
 			return
 		
 		self.plot_widget.clear()
 		
-		months = list(range(len(data)))
-		income = [d['income'] for d in data]
-		expenses = [d['expenses'] for d in data]
-		net = [d['net'] for d in data]
+		# Series as arrays so the bar offsets are vector arithmetic and
+		# pyqtgraph doesn't have to convert lists itself
+		n = len(data)
+		months = np.arange(n, dtype=np.float64)
+		income = np.fromiter((d['income'] for d in data), dtype=np.float64, count=n)
+		expenses = np.fromiter((d['expenses'] for d in data), dtype=np.float64, count=n)
+		net = np.fromiter((d['net'] for d in data), dtype=np.float64, count=n)
 		
 		# Modern colors
 		colors = {
@@ -258,7 +298,7 @@ class ModernChartWindow(QMainWindow):
 		
 		# Create bars with modern styling
 		income_bars = pg.BarGraphItem(
-			x=[m - 0.25 for m in months], 
+			x=months - 0.25, 
 			height=income, 
 			width=0.2, 
 			brush=colors['income'], 
@@ -272,7 +312,7 @@ class ModernChartWindow(QMainWindow):
 			name='💸 Expenses'
 		)
 		net_bars = pg.BarGraphItem(
-			x=[m + 0.25 for m in months], 
+			x=months + 0.25, 
 			height=net, 
 			width=0.2, 
 			brush=colors['net'], 
@@ -288,11 +328,8 @@ class ModernChartWindow(QMainWindow):
 		legend.setBrush(pg.mkBrush(color=(255, 255, 255, 200)))
 		legend.setPen(pg.mkPen(color=(200, 200, 200)))
 	
-	def load_category_data(self, session, start: date, end: date):
+	def load_category_data(self, data: list):
 		"""Load category data into chart."""
-		from finance_app.services.reports import get_category_breakdown
-		
-		data = get_category_breakdown(session, start, end)
 		if not data:
 			return
 		
@@ -302,19 +339,20 @@ class ModernChartWindow(QMainWindow):
 		if not top_5:
 			return
 		
-		y_pos = list(range(len(top_5)))
-		amounts = [d['amount'] for d in top_5]
+		y_pos = np.arange(len(top_5), dtype=np.float64)
+		amounts = np.fromiter((d['amount'] for d in top_5), dtype=np.float64, count=len(top_5))
 		categories = [d['category'] for d in top_5]
 		
 		# Modern gradient colors
 		colors = ['#e74c3c', '#f39c12', '#f1c40f', '#2ecc71', '#3498db']
 		
+		# Horizontal bars: each spans x0=0 to x0+width=amount at its y position
 		bars = pg.BarGraphItem(
-			x=amounts, 
+			x0=0, 
+			width=amounts, 
 			y=y_pos, 
 			height=0.8, 
-			brush=colors[:len(top_5)], 
-			orientation='horizontal'
+			brushes=colors[:len(top_5)]
 		)
 		self.plot_widget.addItem(bars)
 		
@@ -1,29 +1,81 @@
 from __future__ import annotations
 
 from datetime import date, timedelta
+from functools import lru_cache
+from string import Template
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QThreadPool, QTimer
 from PySide6.QtWidgets import (
-	QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox, 
-	QGridLayout, QFrame, QScrollArea, QSizePolicy
+	QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox, QFrame
 )
-from PySide6.QtGui import QFont, QPalette, QColor, QLinearGradient, QBrush
-from PySide6.QtCore import QPropertyAnimation, QEasingCurve, QRect
+from PySide6.QtGui import QFont
 
-try:
-	import pyqtgraph as pg
-	CHARTS_AVAILABLE = True
-except ImportError:
-	CHARTS_AVAILABLE = False
-	pg = None
+from finance_app.services.reports import get_dashboard_stats
+from finance_app.views.workers import QueryWorker
 
-from finance_app.db.context import session_scope
-from finance_app.services.reports import (
-	get_cashflow_by_month,
-	get_category_breakdown,
-	get_uncategorized_count,
-	get_account_balances
-)
+
+# Range changes and refresh clicks within this window trigger a single refresh
+REFRESH_DEBOUNCE_MS = 150
+
+# Stylesheet templates parameterised by accent color (see _styled)
+_STAT_CARD_STYLE = Template("""
+			QFrame {
+				background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+					stop:0 $color, stop:1 ${color}dd);
+				border-radius: 12px;
+				padding: 20px;
+			}
+		""")
+
+_ACTION_BUTTON_STYLE = Template("""
+		QPushButton {
+			background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+				stop:0 $color, stop:1 ${color}dd);
+			color: white;
+			border: none;
+			border-radius: 10px;
+			padding: 15px 25px;
+			font-weight: bold;
+			font-size: 14px;
+			min-width: 120px;
+		}
+		QPushButton:hover {
+			background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+				stop:0 ${color}ee, stop:1 $color);
+		}
+		QPushButton:pressed {
+			background: $color;
+		}
+		""")
+
+_CHART_BUTTON_STYLE = Template("""
+		QPushButton {
+			background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+				stop:0 $color, stop:1 ${color}cc);
+			color: white;
+			border: none;
+			border-radius: 12px;
+			padding: 20px 30px;
+			font-weight: bold;
+			font-size: 16px;
+			min-width: 200px;
+			min-height: 60px;
+		}
+		QPushButton:hover {
+			background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+				stop:0 ${color}ee, stop:1 ${color}dd);
+			transform: scale(1.05);
+		}
+		QPushButton:pressed {
+			background: $color;
+		}
+		""")
+
+
+@lru_cache(maxsize=32)
+def _styled(template: Template, color: str) -> str:
+	"""Return `template` filled in with `color`, built once per pair."""
+	return template.substitute(color=color)
 
 
 class DashboardView(QWidget):
@@ -31,6 +83,18 @@ class DashboardView(QWidget):
 		super().__init__()
 		self.setStyleSheet(self.get_modern_style())
 		
+		# Single-shot timer restarted by each refresh request (see schedule_refresh)
+		self._refresh_timer = QTimer(self)
+		self._refresh_timer.setSingleShot(True)
+		self._refresh_timer.timeout.connect(self.refresh)
+		# Signals of the latest refresh worker; results from older ones are dropped
+		self._pending_refresh = None
+		# Signals of every running worker, kept alive until it reports back
+		self._workers = set()
+		# Chart windows, created on first open and reused afterwards
+		self.cashflow_window = None
+		self.category_window = None
+		
 		# Main layout
 		layout = QVBoxLayout()
 		layout.setContentsMargins(20, 20, 20, 20)
@@ -123,7 +187,7 @@ class DashboardView(QWidget):
 				border-top: 5px solid #667eea;
 			}
 		""")
-		self.range_combo.currentIndexChanged.connect(self.refresh)
+		self.range_combo.currentIndexChanged.connect(self.schedule_refresh)
 		layout.addWidget(self.range_combo)
 		
 		# Refresh button
@@ -146,7 +210,7 @@ class DashboardView(QWidget):
 				background: rgba(255, 255, 255, 0.1);
 			}
 		""")
-		self.refresh_btn.clicked.connect(self.refresh)
+		self.refresh_btn.clicked.connect(self.schedule_refresh)
 		layout.addWidget(self.refresh_btn)
 		
 		return header
@@ -185,14 +249,7 @@ class DashboardView(QWidget):
 	def create_stat_card(self, title: str, value: str, color: str, icon: str) -> QFrame:
 		"""Create a modern stat card."""
 		card = QFrame()
-		card.setStyleSheet(f"""
-			QFrame {{
-				background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-					stop:0 {color}, stop:1 {color}dd);
-				border-radius: 12px;
-				padding: 20px;
-			}}
-		""")
+		card.setStyleSheet(_styled(_STAT_CARD_STYLE, color))
 		layout = QVBoxLayout(card)
 		layout.setSpacing(10)
 		
@@ -257,26 +314,7 @@ class DashboardView(QWidget):
 	
 	def get_action_button_style(self, color: str) -> str:
 		"""Get style for action buttons."""
-		return f"""
-		QPushButton {{
-			background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-				stop:0 {color}, stop:1 {color}dd);
-			color: white;
-			border: none;
-			border-radius: 10px;
-			padding: 15px 25px;
-			font-weight: bold;
-			font-size: 14px;
-			min-width: 120px;
-		}}
-		QPushButton:hover {{
-			background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-				stop:0 {color}ee, stop:1 {color});
-		}}
-		QPushButton:pressed {{
-			background: {color};
-		}}
-		"""
+		return _styled(_ACTION_BUTTON_STYLE, color)
 	
 	def create_charts_section(self) -> QWidget:
 		"""Create charts section with modern buttons."""
@@ -316,28 +354,7 @@ class DashboardView(QWidget):
 	
 	def get_chart_button_style(self, color: str) -> str:
 		"""Get style for chart buttons."""
-		return f"""
-		QPushButton {{
-			background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-				stop:0 {color}, stop:1 {color}cc);
-			color: white;
-			border: none;
-			border-radius: 12px;
-			padding: 20px 30px;
-			font-weight: bold;
-			font-size: 16px;
-			min-width: 200px;
-			min-height: 60px;
-		}}
-		QPushButton:hover {{
-			background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-				stop:0 {color}ee, stop:1 {color}dd);
-			transform: scale(1.05);
-		}}
-		QPushButton:pressed {{
-			background: {color};
-		}}
-		"""
+		return _styled(_CHART_BUTTON_STYLE, color)
 	
 	def open_import(self):
 		"""Open import tab (placeholder)."""
@@ -356,15 +373,27 @@ class DashboardView(QWidget):
 	
 	def open_cashflow_chart(self):
 		"""Open cashflow chart in separate window."""
-		from finance_app.views.chart_window import CashflowChartWindow
-		self.cashflow_window = CashflowChartWindow()
-		self.cashflow_window.show()
+		if self.cashflow_window is None:
+			from finance_app.views.chart_window import CashflowChartWindow
+			self.cashflow_window = CashflowChartWindow()
+		else:
+			self.cashflow_window.load_data()
+		self.show_chart_window(self.cashflow_window)
 	
 	def open_category_chart(self):
 		"""Open category chart in separate window."""
-		from finance_app.views.chart_window import CategoryChartWindow
-		self.category_window = CategoryChartWindow()
-		self.category_window.show()
+		if self.category_window is None:
+			from finance_app.views.chart_window import CategoryChartWindow
+			self.category_window = CategoryChartWindow()
+		else:
+			self.category_window.load_data()
+		self.show_chart_window(self.category_window)
+	
+	def show_chart_window(self, window: QWidget):
+		"""Show a chart window and bring it to the front."""
+		window.show()
+		window.raise_()
+		window.activateWindow()
 
 	def get_date_range(self):
 		"""Get date range based on selection."""
@@ -386,23 +415,34 @@ class DashboardView(QWidget):
 		
 		return start, end
 
+	def schedule_refresh(self):
+		"""Refresh once no further request arrives within REFRESH_DEBOUNCE_MS."""
+		self._refresh_timer.start(REFRESH_DEBOUNCE_MS)
+
 	def refresh(self):
-		"""Refresh dashboard data and update stats cards."""
-		start, end = self.get_date_range()
-		
-		with session_scope() as s:
-			# Update stats cards
-			uncat_count = get_uncategorized_count(s)
-			self.update_stat_card(self.uncat_card, str(uncat_count))
-			
-			balances = get_account_balances(s)
-			total_balance = sum(b['balance'] for b in balances if 'Checking' in b['account'] or 'Savings' in b['account'])
-			self.update_stat_card(self.balance_card, f"${total_balance:,.2f}")
-			
-			# Get transaction count
-			from finance_app.models import models as m
-			transaction_count = s.query(m.Transaction).count()
-			self.update_stat_card(self.transactions_card, str(transaction_count))
+		"""Load dashboard stats on the thread pool; show_stats updates the cards."""
+		worker = QueryWorker(get_dashboard_stats)
+		worker.signals.finished.connect(self.show_stats)
+		worker.signals.failed.connect(self.refresh_failed)
+		self._workers.add(worker.signals)
+		self._pending_refresh = worker.signals
+		QThreadPool.globalInstance().start(worker)
+	
+	def refresh_failed(self, error: Exception):
+		"""Drop a failed refresh worker; the cards keep their last values."""
+		self._workers.discard(self.sender())
+	
+	def show_stats(self, stats: dict):
+		"""Update stats cards with results from refresh (runs on the GUI thread)."""
+		sender = self.sender()
+		self._workers.discard(sender)
+		if sender is not self._pending_refresh:
+			return
+		
+		# Update stats cards
+		self.update_stat_card(self.uncat_card, str(stats['uncategorized']))
+		self.update_stat_card(self.balance_card, f"${stats['cash_balance']:,.2f}")
+		self.update_stat_card(self.transactions_card, str(stats['transactions']))
 	
 	def update_stat_card(self, card: QFrame, value: str):
 		"""Update the value in a stat card."""
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 from PySide6.QtWidgets import (
 	QWidget,
 	QVBoxLayout,
@@ -11,13 +12,51 @@ from PySide6.QtWidgets import (
 	QLabel,
 	QFileDialog,
 	QComboBox,
-	QTableWidget,
-	QTableWidgetItem,
+	QTableView,
 )
 
 from finance_app.db.context import session_scope
 from finance_app.services.importer import preview_dataframe, import_transactions, ImportMapping
 
+if TYPE_CHECKING:
+	# Only for annotations; pandas is loaded by the importer once a CSV is opened
+	import pandas as pd
+
+
+# Rows of the chosen CSV shown in the preview table
+PREVIEW_ROWS = 50
+
+
+class PandasModel(QAbstractTableModel):
+	"""
+	Read-only table model over a DataFrame.
+
+	Cells are formatted from the frame as they are painted, so no item
+	objects are created up front.
+	"""
+
+	def __init__(self, df: pd.DataFrame, parent=None) -> None:
+		super().__init__(parent)
+		self._df = df
+
+	def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+		return 0 if parent.isValid() else self._df.shape[0]
+
+	def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+		return 0 if parent.isValid() else self._df.shape[1]
+
+	def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+		if role != Qt.DisplayRole:
+			return None
+		if orientation == Qt.Horizontal:
+			return str(self._df.columns[section])
+		return str(section + 1)
+
+	def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+		if not index.isValid() or role != Qt.DisplayRole:
+			return None
+		return str(self._df.iat[index.row(), index.column()])
+
 
 class ImportWizard(QWidget):
 	def __init__(self) -> None:
@@ -41,7 +80,7 @@ class ImportWizard(QWidget):
 			map_row.addWidget(w)
 		layout.addLayout(map_row)
 
-		self.preview_table = QTableWidget(0, 0)
+		self.preview_table = QTableView()
 		layout.addWidget(self.preview_table)
 
 		actions = QHBoxLayout()
@@ -59,17 +98,15 @@ class ImportWizard(QWidget):
 			return
 		self.csv_path = Path(fname)
 		self.file_label.setText(self.csv_path.name)
-		df = preview_dataframe(str(self.csv_path))
+		df = preview_dataframe(str(self.csv_path), n=PREVIEW_ROWS)
 		self.date_combo.clear(); self.desc_combo.clear(); self.amount_combo.clear()
 		self.date_combo.addItems(list(df.columns))
 		self.desc_combo.addItems(list(df.columns))
 		self.amount_combo.addItems(list(df.columns))
-		self.preview_table.setColumnCount(len(df.columns))
-		self.preview_table.setHorizontalHeaderLabels(list(df.columns))
-		self.preview_table.setRowCount(len(df.index))
-		for i, (_, row) in enumerate(df.iterrows()):
-			for j, val in enumerate(row):
-				self.preview_table.setItem(i, j, QTableWidgetItem(str(val)))
+		previous = self.preview_table.model()
+		self.preview_table.setModel(PandasModel(df, self.preview_table))
+		if previous is not None:
+			previous.deleteLater()
 
 	def do_import(self):
 		if not self.csv_path:
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QLabel, QTabWidget
-from PySide6.QtGui import QFont
+import importlib
 
-from finance_app.views.dashboard import DashboardView
-from finance_app.views.import_wizard import ImportWizard
-from finance_app.views.transactions import TransactionsView
-from finance_app.views.rules import RulesView
-from finance_app.views.reports import ReportsView
+from PySide6.QtWidgets import QMainWindow, QTabWidget, QWidget
+
+
+# Tabs in display order as (label, module, view class). Each view is imported
+# and built the first time its tab is shown, so startup only pays for the
+# dashboard's imports and queries.
+TABS = (
+	("🏠 Dashboard", "finance_app.views.dashboard", "DashboardView"),
+	("📥 Import", "finance_app.views.import_wizard", "ImportWizard"),
+	("💳 Transactions", "finance_app.views.transactions", "TransactionsView"),
+	("🎯 Rules", "finance_app.views.rules", "RulesView"),
+	("📊 Reports", "finance_app.views.reports", "ReportsView"),
+)
 
 
 class MainWindow(QMainWindow):
@@ -19,17 +25,35 @@ class MainWindow(QMainWindow):
 		self.setStyleSheet(self.get_modern_style())
 
 		# Create modern tab widget
-		tabs = QTabWidget()
-		tabs.setStyleSheet(self.get_tab_style())
+		self.tabs = QTabWidget()
+		self.tabs.setStyleSheet(self.get_tab_style())
 		
-		# Add tabs with icons
-		tabs.addTab(DashboardView(), "🏠 Dashboard")
-		tabs.addTab(ImportWizard(), "📥 Import")
-		tabs.addTab(TransactionsView(), "💳 Transactions")
-		tabs.addTab(RulesView(), "🎯 Rules")
-		tabs.addTab(ReportsView(), "📊 Reports")
+		# Add tabs with icons; placeholders until first shown (see build_tab)
+		for label, _module, _view in TABS:
+			self.tabs.addTab(QWidget(), label)
+		self._built = [False] * len(TABS)
+		self.tabs.currentChanged.connect(self.build_tab)
+		self.build_tab(self.tabs.currentIndex())
 
-		self.setCentralWidget(tabs)
+		self.setCentralWidget(self.tabs)
+	
+	def build_tab(self, index: int) -> None:
+		"""Replace a tab's placeholder with its view the first time it's shown."""
+		if index < 0 or self._built[index]:
+			return
+		self._built[index] = True
+		label, module_name, class_name = TABS[index]
+		view_class = getattr(importlib.import_module(module_name), class_name)
+		placeholder = self.tabs.widget(index)
+		# Swapping the widget moves the current tab; don't re-enter this slot
+		self.tabs.blockSignals(True)
+		try:
+			self.tabs.removeTab(index)
+			self.tabs.insertTab(index, view_class(), label)
+			self.tabs.setCurrentIndex(index)
+		finally:
+			self.tabs.blockSignals(False)
+		placeholder.deleteLater()
 	
 	def get_modern_style(self) -> str:
 		"""Return modern styling for the main window."""
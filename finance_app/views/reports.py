@@ -2,14 +2,12 @@ from __future__ import annotations
 
 from datetime import date, timedelta
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QThreadPool
 from PySide6.QtWidgets import (
-	QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
-	QTableWidget, QTableWidgetItem, QDateEdit, QTextEdit
+	QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QDateEdit, QTextEdit
 )
 
 from finance_app.db.context import session_scope
-from finance_app.models import models as m
 from finance_app.services.posting_generator import generate_all_postings
 from finance_app.services.reports import (
 	get_cashflow_by_month,
@@ -17,6 +15,54 @@ from finance_app.services.reports import (
 	get_account_balances,
 	get_reconciliation_report
 )
+from finance_app.views.workers import QueryWorker
+
+
+def _format_cashflow(data: list) -> str:
+	lines = [
+		"Cashflow by Month:\n",
+		f"{'Month':<10} {'Income':>12} {'Expenses':>12} {'Net':>12}",
+		"-" * 50,
+	]
+	lines += [
+		f"{row['month']:<10} ${row['income']:>11,.2f} ${row['expenses']:>11,.2f} ${row['net']:>11,.2f}"
+		for row in data
+	]
+	return "\n".join(lines) + "\n"
+
+
+def _format_category(data: list) -> str:
+	lines = [
+		"Expenses by Category:\n",
+		f"{'Category':<30} {'Amount':>12}",
+		"-" * 45,
+	]
+	lines += [f"{row['category']:<30} ${row['amount']:>11,.2f}" for row in data]
+	total = sum(r['amount'] for r in data)
+	lines += ["-" * 45, f"{'TOTAL':<30} ${total:>11,.2f}"]
+	return "\n".join(lines) + "\n"
+
+
+def _format_balances(data: list) -> str:
+	lines = [
+		"Account Balances:\n",
+		f"{'Account':<30} {'Balance':>12}",
+		"-" * 45,
+	]
+	lines += [f"{row['account']:<30} ${row['balance']:>11,.2f}" for row in data]
+	return "\n".join(lines) + "\n"
+
+
+def _format_reconciliation(data: dict) -> str:
+	text = f"Reconciliation Report\n"
+	text += f"Period: {data['period_start']} to {data['period_end']}\n\n"
+	text += f"Opening Balance:    ${data['opening_balance']:>11,.2f}\n"
+	text += f"Inflows:            ${data['inflows']:>11,.2f}\n"
+	text += f"Outflows:          -${data['outflows']:>11,.2f}\n"
+	text += "-" * 40 + "\n"
+	text += f"Closing Balance:    ${data['closing_balance']:>11,.2f}\n\n"
+	text += f"Transaction Count:  {data['transaction_count']}\n"
+	return text
 
 
 class ReportsView(QWidget):
@@ -60,6 +106,9 @@ class ReportsView(QWidget):
 		btn_row.addWidget(self.reconcile_btn)
 		
 		layout.addLayout(btn_row)
+		self.report_buttons = (self.cashflow_btn, self.category_btn, self.balances_btn, self.reconcile_btn)
+		# Signals of every running worker, kept alive until it reports back
+		self._workers = set()
 
 		# Output area
 		self.output = QTextEdit()
@@ -73,59 +122,48 @@ class ReportsView(QWidget):
 			count = generate_all_postings(s)
 		self.output.setText(f"Generated postings for {count} transactions")
 
-	def show_cashflow(self):
-		start = self.start_date.date().toPython()
-		end = self.end_date.date().toPython()
-		with session_scope() as s:
-			data = get_cashflow_by_month(s, start, end)
-		
-		text = "Cashflow by Month:\n\n"
-		text += f"{'Month':<10} {'Income':>12} {'Expenses':>12} {'Net':>12}\n"
-		text += "-" * 50 + "\n"
-		for row in data:
-			text += f"{row['month']:<10} ${row['income']:>11,.2f} ${row['expenses']:>11,.2f} ${row['net']:>11,.2f}\n"
+	def get_date_range(self) -> tuple[date, date]:
+		return self.start_date.date().toPython(), self.end_date.date().toPython()
+
+	def run_report(self, query) -> None:
+		"""
+		Run a report query and its formatting on the thread pool.
+
+		The report buttons stay disabled until show_report() receives the text
+		(or report_failed() the error).
+
+		Args:
+			query: Called with a session; returns the report text
+		"""
+		for btn in self.report_buttons:
+			btn.setEnabled(False)
+		worker = QueryWorker(query)
+		worker.signals.finished.connect(self.show_report)
+		worker.signals.failed.connect(self.report_failed)
+		self._workers.add(worker.signals)
+		QThreadPool.globalInstance().start(worker)
+
+	def show_report(self, text: str):
+		self._workers.discard(self.sender())
 		self.output.setText(text)
+		for btn in self.report_buttons:
+			btn.setEnabled(True)
+
+	def report_failed(self, error: Exception):
+		self.show_report(f"Report failed: {error}\n")
+
+	def show_cashflow(self):
+		start, end = self.get_date_range()
+		self.run_report(lambda s: _format_cashflow(get_cashflow_by_month(s, start, end)))
 
 	def show_category(self):
-		start = self.start_date.date().toPython()
-		end = self.end_date.date().toPython()
-		with session_scope() as s:
-			data = get_category_breakdown(s, start, end)
-		
-		text = "Expenses by Category:\n\n"
-		text += f"{'Category':<30} {'Amount':>12}\n"
-		text += "-" * 45 + "\n"
-		for row in data:
-			text += f"{row['category']:<30} ${row['amount']:>11,.2f}\n"
-		total = sum(r['amount'] for r in data)
-		text += "-" * 45 + "\n"
-		text += f"{'TOTAL':<30} ${total:>11,.2f}\n"
-		self.output.setText(text)
+		start, end = self.get_date_range()
+		self.run_report(lambda s: _format_category(get_category_breakdown(s, start, end)))
 
 	def show_balances(self):
-		with session_scope() as s:
-			data = get_account_balances(s)
-		
-		text = "Account Balances:\n\n"
-		text += f"{'Account':<30} {'Balance':>12}\n"
-		text += "-" * 45 + "\n"
-		for row in data:
-			text += f"{row['account']:<30} ${row['balance']:>11,.2f}\n"
-		self.output.setText(text)
+		self.run_report(lambda s: _format_balances(get_account_balances(s)))
 
 	def show_reconciliation(self):
-		start = self.start_date.date().toPython()
-		end = self.end_date.date().toPython()
-		with session_scope() as s:
-			data = get_reconciliation_report(s, start, end)
-		
-		text = f"Reconciliation Report\n"
-		text += f"Period: {data['period_start']} to {data['period_end']}\n\n"
-		text += f"Opening Balance:    ${data['opening_balance']:>11,.2f}\n"
-		text += f"Inflows:            ${data['inflows']:>11,.2f}\n"
-		text += f"Outflows:          -${data['outflows']:>11,.2f}\n"
-		text += "-" * 40 + "\n"
-		text += f"Closing Balance:    ${data['closing_balance']:>11,.2f}\n\n"
-		text += f"Transaction Count:  {data['transaction_count']}\n"
-		self.output.setText(text)
+		start, end = self.get_date_range()
+		self.run_report(lambda s: _format_reconciliation(get_reconciliation_report(s, start, end)))
 
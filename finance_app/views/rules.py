@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QTableWidget, QTableWidgetItem, QLineEdit, QSpinBox, QCheckBox
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QTableWidget, QTableWidgetItem, QLineEdit, QSpinBox, QCheckBox, QHeaderView
+
+from sqlalchemy import select
 
 from finance_app.db.context import session_scope
 from finance_app.models import models as m
@@ -30,6 +31,8 @@ class RulesView(QWidget):
 
 		self.table = QTableWidget(0, 6)
 		self.table.setHorizontalHeaderLabels(["Pattern", "CategoryId", "Min", "Max", "Priority", "Active"])
+		# Fixed row heights: no per-row resize to contents as rows are filled
+		self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
 		layout.addWidget(self.table)
 
 		self.result_label = QLabel("")
@@ -39,11 +42,18 @@ class RulesView(QWidget):
 		self.refresh()
 
 	def refresh(self):
-		self.table.setRowCount(0)
 		with session_scope() as s:
 			rules = s.query(m.Rule).order_by(m.Rule.priority.asc()).all()
+			# Category given to new rules; read here so add_rule needn't query
+			self._default_category_id = s.scalar(select(m.Category.id).order_by(m.Category.id).limit(1))
+		# Size the table once and fill it with repaints and signals off,
+		# rather than relaying it out after every inserted row
+		self.table.setUpdatesEnabled(False)
+		self.table.blockSignals(True)
+		try:
+			self.table.setRowCount(0)
+			self.table.setRowCount(len(rules))
 			for i, r in enumerate(rules):
-				self.table.insertRow(i)
 				pattern = QLineEdit(r.pattern)
 				self.table.setCellWidget(i, 0, pattern)
 				self.table.setItem(i, 1, QTableWidgetItem(str(r.category_id)))
@@ -58,10 +68,16 @@ class RulesView(QWidget):
 				active = QCheckBox()
 				active.setChecked(r.active)
 				self.table.setCellWidget(i, 5, active)
+		finally:
+			self.table.blockSignals(False)
+			self.table.setUpdatesEnabled(True)
 
 	def add_rule(self):
+		if self._default_category_id is None:
+			self.result_label.setText("Add a category before adding rules")
+			return
 		with session_scope() as s:
-			r = m.Rule(pattern="", category_id=s.query(m.Category.id).first()[0], priority=100, active=True)
+			r = m.Rule(pattern="", category_id=self._default_category_id, priority=100, active=True)
 			s.add(r)
 		self.refresh()
 
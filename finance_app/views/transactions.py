@@ -1,10 +1,133 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QTableWidget, QTableWidgetItem, QComboBox
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtGui import QStandardItem, QStandardItemModel
+from PySide6.QtWidgets import (
+	QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableView, QComboBox, QStyledItemDelegate, QAbstractItemView
+)
+from sqlalchemy import String, cast, func, select
 
 from finance_app.db.context import session_scope
 from finance_app.models import models as m
+from finance_app.services.rules_engine import assign_categories
+
+
+class TransactionsModel(QAbstractTableModel):
+	"""
+	Table model over the most recent transactions.
+
+	Rows are plain (id, date, description, amount, source, category_id) lists
+	loaded once per refresh, so the view only builds what it paints. Category
+	edits are applied to the rows and recorded in `pending` until saved.
+
+	Attributes:
+		categories (Dict[int, str]): Category names keyed by ID
+		category_items (QStandardItemModel): Blank entry plus every category,
+			shared by all category editors
+		pending (Dict[int, Optional[int]]): Edited category IDs keyed by transaction ID
+	"""
+	HEADERS = ["Date", "Description", "Amount", "Source", "Category"]
+	CATEGORY_COLUMN = 4
+
+	def __init__(self, parent=None) -> None:
+		super().__init__(parent)
+		self._rows: List[list] = []
+		self.categories: Dict[int, str] = {}
+		self.category_items = QStandardItemModel(self)
+		self.pending: Dict[int, Optional[int]] = {}
+
+	def load(self, rows: List[list], categories: Optional[Dict[int, str]] = None) -> None:
+		"""
+		Replace the model's rows, dropping unsaved edits.
+
+		Args:
+			rows: Transaction rows to show
+			categories: New category names by ID, or None to keep the current
+				ones (and the shared editor items built from them)
+		"""
+		self.beginResetModel()
+		self._rows = rows
+		if categories is not None:
+			self.categories = categories
+		self.pending = {}
+		self.endResetModel()
+		if categories is None:
+			return
+		# Built once per category change rather than once per opened editor
+		self.category_items.clear()
+		self.category_items.appendRow(QStandardItem(""))
+		for cid, name in categories.items():
+			item = QStandardItem(name)
+			item.setData(cid, Qt.UserRole)
+			self.category_items.appendRow(item)
+
+	def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+		return 0 if parent.isValid() else len(self._rows)
+
+	def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+		return 0 if parent.isValid() else len(self.HEADERS)
+
+	def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+		if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+			return self.HEADERS[section]
+		return None
+
+	def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+		if not index.isValid():
+			return None
+		txn_id, txn_date, description, amount, source, category_id = self._rows[index.row()]
+		column = index.column()
+		if role == Qt.EditRole and column == self.CATEGORY_COLUMN:
+			return category_id
+		if role != Qt.DisplayRole:
+			return None
+		if column == 0:
+			return str(txn_date)
+		if column == 1:
+			return description
+		if column == 2:
+			return f"{amount:.2f}"
+		if column == 3:
+			return source
+		return self.categories.get(category_id, "")
+
+	def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+		flags = super().flags(index)
+		if index.column() == self.CATEGORY_COLUMN:
+			flags |= Qt.ItemIsEditable
+		return flags
+
+	def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
+		if role != Qt.EditRole or index.column() != self.CATEGORY_COLUMN:
+			return False
+		row = self._rows[index.row()]
+		if value == row[5]:
+			return False
+		row[5] = value
+		self.pending[row[0]] = value
+		self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+		return True
+
+
+class CategoryDelegate(QStyledItemDelegate):
+	"""Edits the Category column with a combo box, created only while editing."""
+
+	def createEditor(self, parent: QWidget, option, index: QModelIndex) -> QComboBox:
+		combo = QComboBox(parent)
+		combo.setModel(index.model().category_items)
+		# Commit as soon as a category is picked rather than on focus loss
+		combo.activated.connect(lambda _i: self.commitData.emit(combo))
+		return combo
+
+	def setEditorData(self, editor: QComboBox, index: QModelIndex) -> None:
+		idx = editor.findData(index.data(Qt.EditRole))
+		editor.setCurrentIndex(idx if idx >= 0 else 0)
+
+	def setModelData(self, editor: QComboBox, model: QAbstractTableModel, index: QModelIndex) -> None:
+		model.setData(index, editor.currentData(), Qt.EditRole)
 
 
 class TransactionsView(QWidget):
@@ -21,66 +144,54 @@ class TransactionsView(QWidget):
 		toolbar.addWidget(self.save_btn)
 		layout.addLayout(toolbar)
 
-		self.table = QTableWidget(0, 5)
-		self.table.setHorizontalHeaderLabels(["Date", "Description", "Amount", "Source", "Category"])
+		self.model = TransactionsModel(self)
+		self.table = QTableView()
+		self.table.setModel(self.model)
+		self.table.setItemDelegateForColumn(TransactionsModel.CATEGORY_COLUMN, CategoryDelegate(self.table))
+		self.table.setEditTriggers(QAbstractItemView.CurrentChanged | QAbstractItemView.SelectedClicked | QAbstractItemView.DoubleClicked)
 		layout.addWidget(self.table)
 
 		self.setLayout(layout)
-		self._pending_category_updates: list[tuple[int, int]] = []  # (row, category_id)
+		# Signature (see refresh) of the categories last loaded into the model
+		self._category_signature = None
 		self.refresh()
 
 	def refresh(self):
-		self.table.setRowCount(0)
 		with session_scope() as s:
-			categories = {c.id: c.name for c in s.query(m.Category).order_by(m.Category.name).all()}
-			rows = (
-				s.query(m.Transaction, m.Account)
+			# Categories rarely change, so only reload them (and rebuild the
+			# editor items) when their "id:name" list has changed. That catches
+			# renames and a deleted id being reused, unlike a count/max-id check.
+			ordered = select(m.Category.id, m.Category.name).order_by(m.Category.id).subquery()
+			signature = s.scalar(
+				select(func.group_concat(cast(ordered.c.id, String) + ":" + ordered.c.name, "\n"))
+			)
+			categories = None
+			if signature != self._category_signature:
+				categories = dict(s.execute(select(m.Category.id, m.Category.name).order_by(m.Category.name)).all())
+				self._category_signature = signature
+			rows = s.execute(
+				select(
+					m.Transaction.id,
+					m.Transaction.date,
+					m.Transaction.description,
+					m.Transaction.amount,
+					m.Account.name,
+					m.Transaction.category_id,
+				)
 				.join(m.Account, m.Account.id == m.Transaction.source_account_id)
 				.order_by(m.Transaction.date.desc())
 				.limit(500)
-				.all()
-			)
-			for i, (txn, acct) in enumerate(rows):
-				self.table.insertRow(i)
-				self.table.setItem(i, 0, QTableWidgetItem(str(txn.date)))
-				self.table.setItem(i, 1, QTableWidgetItem(txn.description))
-				self.table.setItem(i, 2, QTableWidgetItem(f"{float(txn.amount):.2f}"))
-				self.table.setItem(i, 3, QTableWidgetItem(acct.name))
-				combo = QComboBox()
-				combo.addItem("", -1)
-				for cid, name in categories.items():
-					combo.addItem(name, cid)
-				if txn.category_id:
-					idx = combo.findData(txn.category_id)
-					combo.setCurrentIndex(idx if idx >= 0 else 0)
-				combo.currentIndexChanged.connect(lambda _i, row=i, w=combo: self._on_category_changed(row, w))
-				self.table.setCellWidget(i, 4, combo)
-
-	def _on_category_changed(self, row: int, widget: QComboBox):
-		category_id = widget.currentData()
-		self._pending_category_updates.append((row, category_id))
+			).all()
+		self.model.load([list(r) for r in rows], categories)
 
 	def save_changes(self):
-		if not self._pending_category_updates:
+		if not self.model.pending:
 			return
-		ids_to_update: list[tuple[int, int]] = []  # (txn_id, category_id)
+		# Edited transaction IDs grouped by their new category
+		groups: Dict[Optional[int], List[int]] = defaultdict(list)
+		for txn_id, category_id in self.model.pending.items():
+			groups[category_id].append(txn_id)
 		with session_scope() as s:
-			rows = (
-				s.query(m.Transaction.id)
-				.order_by(m.Transaction.date.desc())
-				.limit(500)
-				.all()
-			)
-			id_by_row = [row[0] for row in rows]
-			for row_idx, category_id in self._pending_category_updates:
-				if 0 <= row_idx < len(id_by_row):
-					ids_to_update.append((id_by_row[row_idx], category_id if isinstance(category_id, int) and category_id > 0 else None))
-			for txn_id, category_id in ids_to_update:
-				txn = s.get(m.Transaction, txn_id)
-				if txn is not None:
-					txn.category_id = category_id
-
-		self._pending_category_updates.clear()
-		self.refresh()
-
+			assign_categories(s, groups)
 
+		self.refresh()
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import traceback
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from finance_app.db.context import session_scope
+
+
+class _QuerySignals(QObject):
+	"""Signals for QueryWorker (QRunnable isn't a QObject, so it can't own them)."""
+	finished = Signal(object)
+	failed = Signal(object)
+
+
+class QueryWorker(QRunnable):
+	"""
+	Run a database query on a QThreadPool thread.
+	
+	`query` is called with a session from session_scope() on the pool thread.
+	Its result is emitted through `signals.finished`, or the exception it
+	raised through `signals.failed`. The signals object is created on the
+	thread that builds the worker (the GUI thread), so connected widget slots
+	run there and can safely update widgets.
+	
+	Nothing else references `signals` once the worker is started, so the
+	caller must hold on to it until one of the two signals fires.
+	
+	Usage:
+		worker = QueryWorker(get_dashboard_stats)
+		worker.signals.finished.connect(self.show_stats)
+		worker.signals.failed.connect(self.stats_failed)
+		self._workers.add(worker.signals)
+		QThreadPool.globalInstance().start(worker)
+	"""
+	
+	def __init__(self, query: Callable[[Any], Any]) -> None:
+		super().__init__()
+		self.query = query
+		self.signals = _QuerySignals()
+	
+	def run(self) -> None:
+		try:
+			with session_scope() as s:
+				result = self.query(s)
+		except Exception as e:
+			traceback.print_exc()
+			self.signals.failed.emit(e)
+			return
+		self.signals.finished.emit(result)
@@ -12,105 +12,154 @@ TOP_PRODUCTS = "../output/sales_summary.csv"
 DB_PATH = "../output/sales_data.db"
 SQL_QUERIES = "../sql/analytics_queries.sql"
 
+# Rows read per chunk; memory use is bounded by this, not the input size
+CHUNK_SIZE = 500_000
+
+# Column types given to the CSV reader so it doesn't infer them per chunk.
+# quantity is read as float so rows with a missing quantity still parse;
+# clean() drops those and then casts it to int.
+RAW_DTYPES = {'product': 'str', 'quantity': 'float64', 'price': 'float64'}
+
+# SQLite settings for the load: WAL journal and no fsync per transaction
+# (the database is rebuilt from the CSV on every run anyway)
+SQLITE_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+"""
+
+# Rows per executemany batch when loading into SQLite
+SQLITE_BATCH_ROWS = 50_000
+
 # ------------------------
 # Step 1 - Extract
 # ------------------------
 def extract():
-    """Load raw CSV data"""
-    return pd.read_csv(RAW_DATA)
+    """Stream raw CSV data in chunks of CHUNK_SIZE rows (always at least one)"""
+    with pd.read_csv(RAW_DATA, chunksize=CHUNK_SIZE, engine='c', dtype=RAW_DTYPES, parse_dates=['date']) as reader:
+        empty = True
+        for chunk in reader:
+            empty = False
+            yield chunk
+    if empty:
+        # Header-only input: one empty chunk, so the outputs are still
+        # written (with headers and no rows) instead of main() failing
+        yield pd.DataFrame({
+            'date': pd.Series(dtype='datetime64[ns]'),
+            **{col: pd.Series(dtype=dtype) for col, dtype in RAW_DTYPES.items()},
+        })
 
 # ------------------------
-# Step 2 - Validate
-# ------------------------
-def validate(df):
-    """Clean and validate data"""
-    df = df.dropna()                      # remove nulls
-    df = df[df['quantity'] > 0]           # remove negative quantities
-    df['date'] = pd.to_datetime(df['date'])
-    df['quantity'] = df['quantity'].astype(int)
-    df['price'] = df['price'].astype(float)
-    return df
+# Step 2 - Validate & Transform
+# ------------------------
+def clean(df):
+    """Validate rows and add revenue and date metrics in a single pass"""
+    # Rows with no nulls and a positive quantity; date and price already
+    # have their types from extract()
+    keep = df.notna().all(axis=1).to_numpy() & (df['quantity'].to_numpy() > 0)
+    dates = pd.DatetimeIndex(df['date'].to_numpy()[keep])
+    quantity = df['quantity'].to_numpy()[keep].astype(int)
+    price = df['price'].to_numpy()[keep]
+    # Build the cleaned frame in one go instead of filtering and then
+    # adding columns one at a time, which copies the frame repeatedly
+    return pd.DataFrame({
+        'date': dates,
+        'product': df['product'].to_numpy()[keep],
+        'quantity': quantity,
+        'price': price,
+        'revenue': quantity * price,
+        'year': dates.year,
+        'month': dates.month,
+        'day': dates.day,
+    })
 
 # ------------------------
-# Step 3 - Transform
+# Step 3 - Aggregate
 # ------------------------
-def transform(df):
-    """Add revenue and date metrics"""
-    df['revenue'] = df['quantity'] * df['price']
-    df['year'] = df['date'].dt.year
-    df['month'] = df['date'].dt.month
-    df['day'] = df['date'].dt.day
-    return df
+def aggregate(df, daily_totals=None, product_totals=None):
+    """Add a chunk's revenue to the running daily and per-product totals"""
+    daily = df.groupby('date')['revenue'].sum()
+    products = df.groupby('product')['revenue'].sum()
+    if daily_totals is not None:
+        daily = daily_totals.add(daily, fill_value=0)
+        products = product_totals.add(products, fill_value=0)
+    return daily, products
 
-# ------------------------
-# Step 4 - Aggregate
-# ------------------------
-def aggregate(df):
-    """Generate analytics tables"""
-    daily_sales = df.groupby('date')['revenue'].sum().reset_index()
-    top_products = df.groupby('product')['revenue'].sum().sort_values(ascending=False).reset_index()
+def summarize(daily_totals, product_totals):
+    """Generate analytics tables from the running totals"""
+    daily_sales = daily_totals.sort_index().reset_index()
+    top_products = product_totals.sort_values(ascending=False).reset_index()
     return daily_sales, top_products
 
 # ------------------------
-# Step 5 - Output CSVs
+# Step 4 - Output CSVs
 # ------------------------
-def output(df_clean, daily_sales, top_products):
-    """Save CSV outputs"""
-    os.makedirs("../output", exist_ok=True)
-    df_clean.to_csv(CLEANED_DATA, index=False)
+def output_cleaned(df_clean, first_chunk):
+    """Write a chunk of cleaned data (the first chunk replaces the file)"""
+    df_clean.to_csv(CLEANED_DATA, index=False, mode='w' if first_chunk else 'a', header=first_chunk)
+
+def output(daily_sales, top_products):
+    """Save analytics CSV outputs"""
     daily_sales.to_csv(DAILY_SALES, index=False)
     top_products.to_csv(TOP_PRODUCTS, index=False)
     print("CSV outputs saved in 'output/' folder.")
 
 # ------------------------
-# Step 6 - Load to SQLite
+# Step 5 - Load to SQLite
 # ------------------------
-def load_to_sqlite(df_clean):
-    """Load cleaned data into SQLite database"""
-    os.makedirs("../output", exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
-    df_clean.to_sql('sales', conn, if_exists='replace', index=False)
-    conn.close()
-    print(f"Cleaned data loaded into SQLite DB at {DB_PATH}")
+def load_to_sqlite(df_clean, conn, first_chunk):
+    """Load a chunk of cleaned data into SQLite (the first chunk replaces the table)"""
+    df_clean.to_sql(
+        'sales', conn, if_exists='replace' if first_chunk else 'append', index=False, chunksize=SQLITE_BATCH_ROWS
+    )
 
 # ------------------------
-# Step 7 - Run SQL Analytics
+# Step 6 - Run SQL Analytics
 # ------------------------
-def run_sql_queries():
+def run_sql_queries(conn):
     """Run analytics queries from SQL file"""
-    conn = sqlite3.connect(DB_PATH)
-    
-    print("\n--- Top Products by Revenue ---")
-    query1 = """
-    SELECT product, SUM(revenue) AS total_revenue
+    # One scan of the table, grouped by (product, date); both reports are
+    # rolled up from these per-day product totals rather than each
+    # re-scanning and re-grouping the whole table
+    query = """
+    SELECT product, date, SUM(revenue) AS revenue
     FROM sales
-    GROUP BY product
-    ORDER BY total_revenue DESC;
+    GROUP BY product, date;
     """
-    print(pd.read_sql_query(query1, conn))
+    totals = pd.read_sql_query(query, conn)
+
+    print("\n--- Top Products by Revenue ---")
+    top_products = totals.groupby('product')['revenue'].sum().sort_values(ascending=False)
+    print(top_products.rename('total_revenue').reset_index())
 
     print("\n--- Daily Revenue ---")
-    query2 = """
-    SELECT date, SUM(revenue) AS daily_revenue
-    FROM sales
-    GROUP BY date
-    ORDER BY date;
-    """
-    print(pd.read_sql_query(query2, conn))
-    
-    conn.close()
+    daily_revenue = totals.groupby('date')['revenue'].sum()
+    print(daily_revenue.rename('daily_revenue').reset_index())
 
 # ------------------------
 # Main Function
 # ------------------------
 def main():
-    df_raw = extract()
-    df_clean = validate(df_raw)
-    df_transformed = transform(df_clean)
-    daily_sales, top_products = aggregate(df_transformed)
-    output(df_transformed, daily_sales, top_products)
-    load_to_sqlite(df_transformed)
-    run_sql_queries()
+    os.makedirs("../output", exist_ok=True)
+    daily_totals = product_totals = None
+    # One connection for the load and the analytics queries
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        conn.executescript(SQLITE_PRAGMAS)
+        # Each chunk is cleaned, written out and folded into the totals before
+        # the next is read, so only one chunk is held in memory at a time
+        for i, df_raw in enumerate(extract()):
+            df_clean = clean(df_raw)
+            daily_totals, product_totals = aggregate(df_clean, daily_totals, product_totals)
+            output_cleaned(df_clean, first_chunk=i == 0)
+            load_to_sqlite(df_clean, conn, first_chunk=i == 0)
+        conn.commit()
+        print(f"Cleaned data loaded into SQLite DB at {DB_PATH}")
+        daily_sales, top_products = summarize(daily_totals, product_totals)
+        output(daily_sales, top_products)
+        run_sql_queries(conn)
+    finally:
+        conn.close()
 
 # ------------------------
 # Run Pipeline